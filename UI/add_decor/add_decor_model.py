@@ -6,7 +6,7 @@ Responsibilities:
 - Link the caller user <-> decor using RelationType.
 """
 from typing import Optional, Dict, Any
-import requests
+from urllib.parse import quote
 from UI import server_access
 
 class AddDecorModel:
@@ -18,7 +18,7 @@ class AddDecorModel:
         """
         Uses /DB/users/get_user_by_name/{username} to get the user
         """
-        path = f"/DB/users/get_user_by_name/{requests.utils.quote(username)}"
+        path = f"/DB/users/get_user_by_name/{quote(username)}"
         return server_access.request(path)
 
     def ensure_user(self, phone: str, username: str, password_hash: str, region: str) -> int:
@@ -33,10 +33,10 @@ class AddDecorModel:
 
         path = (
             f"/DB/users/insert_user/"
-            f"{requests.utils.quote(phone)}/"
-            f"{requests.utils.quote(username)}/"
-            f"{requests.utils.quote(password_hash)}/"
-            f"{requests.utils.quote(region)}"
+            f"{quote(phone)}/"
+            f"{quote(username)}/"
+            f"{quote(password_hash)}/"
+            f"{quote(region)}"
         )
         return int(server_access.request(path))
 
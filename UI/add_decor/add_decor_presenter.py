@@ -7,7 +7,7 @@ AddDecorPresenter
 
 from typing import Dict, Any, Tuple
 from PySide6.QtCore import QObject
-from add_decor_model import AddDecorModel
+from .add_decor_model import AddDecorModel
 
 CATEGORIES = [
     "Balloons","Flowers","Tableware","Linens","Lighting",
@@ -2,9 +2,9 @@
 from __future__ import annotations
 from pathlib import Path
 from typing import Tuple
-from chat_model import ChatModel, ChatSettings
-from chat_view import ChatView
-from chat_presenter import ChatPresenter
+from .chat_model import ChatModel, ChatSettings
+from .chat_view import ChatView
+from .chat_presenter import ChatPresenter
 
 def build_chat_module(project_root: Path, python_exe: str) -> Tuple[ChatView, ChatPresenter]:
     """
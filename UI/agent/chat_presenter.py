@@ -5,8 +5,8 @@ Presenter for the Chat screen (MVP).
 - Applies model results back to the view (answer or error).
 """
 from __future__ import annotations
-from chat_model import ChatModel
-from chat_view import ChatView
+from .chat_model import ChatModel
+from .chat_view import ChatView
 
 class ChatPresenter:
     def __init__(self, model: ChatModel, view: ChatView):
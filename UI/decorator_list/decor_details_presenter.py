@@ -7,12 +7,15 @@ class DecorDetailsPresenter(QObject):
         super().__init__()
         self.model = model
         self.view = view
+        self.bound_id = None  # id the page shows; None after a failed load
 
     def start(self, decor_id: int):
         self.view.set_busy(True)
+        self.bound_id = decor_id
         try:
             row = self.model.fetch(decor_id) or {}
         except Exception as e:
+            self.bound_id = None
             self.view.show_error(str(e))
             self.view.set_busy(False)
             return
@@ -3,8 +3,6 @@ Model: Fetches decor catalog from the server (no local fallbacks).
 """
 from typing import List, Dict, Any, Optional
 from UI import server_access
-from server.database.image_loader import IMAGE_LOADER
-from PySide6.QtCore import Qt
 
 class DecorListModel:
     def __init__(self) -> None:
@@ -5,7 +5,7 @@ Presenter: ties View <-> Model (MVP)
 """
 from typing import Dict, Any
 from PySide6.QtCore import QObject
-from decor_list_model import DecorListModel
+from .decor_list_model import DecorListModel
 
 class DecorListPresenter(QObject):
     def __init__(self, model: DecorListModel, view) -> None:
@@ -5,41 +5,30 @@ View: Modern card grid + search/category/availability filters
 """
 from pathlib import Path
 from typing import Optional, List, Dict
-from PySide6.QtCore import (Qt, QSize, Signal,
-                            QPropertyAnimation, QEasingCurve, QRect, QTimer)
+from PySide6.QtCore import Qt, QSize, Signal, QPropertyAnimation, QTimer
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QComboBox, QCheckBox,
-    QPushButton, QScrollArea, QFrame, QGridLayout, QSizePolicy, QSpacerItem,
-    QMessageBox, QGraphicsDropShadowEffect
+    QPushButton, QScrollArea, QFrame, QGridLayout, QSizePolicy, QMessageBox
 )
-from server.database.image_loader import load_into
+from server.database.image_loader import load_into, normalize_url
+from UI.ui_helpers import read_qss, LIST_QSS, HoverCardMixin, make_hover_anim, CardGrid
 
 BASE_DIR = Path(__file__).resolve().parent
 
-def _apply_shadow(widget, radius=18, x_offset=0, y_offset=6):
-    eff = QGraphicsDropShadowEffect(widget)
-    eff.setBlurRadius(radius)
-    eff.setOffset(x_offset, y_offset)
-    widget.setGraphicsEffect(eff)
-
-class DecorCard(QFrame):
+class DecorCard(HoverCardMixin, QFrame):
     clicked = Signal(int)
 
-    def __init__(self, vm: Dict):
+    def __init__(self, vm: Dict, hover_anim: Optional[QPropertyAnimation] = None):
+        # hover_anim: shared animation owned by the list view (one per card otherwise)
         super().__init__(objectName="Card")
         self.vm = vm
         self.setCursor(Qt.PointingHandCursor)
         self.setMouseTracking(True)
         self.setMinimumSize(300, 270)
         self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-        _apply_shadow(self, radius=18, y_offset=6)
-
-        # Hover animation
-        self._base_geom: Optional[QRect] = None
-        self._anim = QPropertyAnimation(self, b"geometry", self)
-        self._anim.setDuration(140)
-        self._anim.setEasingCurve(QEasingCurve.OutCubic)
-        self._grow_px = 8
+        # border from QSS (Card[flat="true"]) instead of a per-card drop-shadow effect
+        self.setProperty("flat", True)
+        self._init_hover(hover_anim)
 
         self._build()
 
@@ -54,48 +43,50 @@ class DecorCard(QFrame):
         img.setAlignment(Qt.AlignCenter)
         self._img = img
 
-        url = self.vm.get("photo") or "https://cdn.jsdelivr.net/gh/MaiEden/pic-DB-events-app@main/dfault.png"
-        load_into(img, url, size=QSize(420, 160))
-
-        title = QLabel(self.vm.get("title", ""), objectName="CardTitle")
-        subtitle = QLabel(self.vm.get("subtitle", ""), objectName="CardSubtitle")
+        self._title = QLabel(objectName="CardTitle")
+        self._subtitle = QLabel(objectName="CardSubtitle")
 
         meta = QHBoxLayout()
-        price = QLabel(self.vm.get("price", ""), objectName="Price")
-        region = QLabel(self.vm.get("region") or "", objectName="Region")
-        pill = QLabel("Available" if self.vm.get("available") else "Unavailable", objectName="Pill")
-        pill.setProperty("ok", bool(self.vm.get("available")))
-        meta.addWidget(price)
+        self._price = QLabel(objectName="Price")
+        self._region = QLabel(objectName="Region")
+        self._pill = QLabel(objectName="Pill")
+        meta.addWidget(self._price)
         meta.addStretch(1)
-        meta.addWidget(region)
-        meta.addWidget(pill)
+        meta.addWidget(self._region)
+        meta.addWidget(self._pill)
 
         lay.addWidget(img)
         lay.addSpacing(6)
-        lay.addWidget(title)
-        lay.addWidget(subtitle)
+        lay.addWidget(self._title)
+        lay.addWidget(self._subtitle)
         lay.addLayout(meta)
 
-    # Hover grow/shrink
-    def enterEvent(self, e):
-        if self._base_geom is None:
-            self._base_geom = self.geometry()
-        g = self._base_geom
-        grow = self._grow_px
-        target = QRect(g.x() - grow // 2, g.y() - grow // 2, g.width() + grow, g.height() + grow)
-        self._anim.stop()
-        self._anim.setStartValue(self.geometry())
-        self._anim.setEndValue(target)
-        self._anim.start()
-        super().enterEvent(e)
-
-    def leaveEvent(self, e):
-        if self._base_geom is not None:
-            self._anim.stop()
-            self._anim.setStartValue(self.geometry())
-            self._anim.setEndValue(self._base_geom)
-            self._anim.start()
-        super().leaveEvent(e)
+        self._apply_vm()
+
+    def update_vm(self, vm: Dict):
+        # rebind to another view-model (cards are reused by CardGrid)
+        if vm is self.vm or vm == self.vm:
+            return
+        self.vm = vm
+        self._apply_vm()
+
+    def _apply_vm(self):
+        vm = self.vm
+        url = vm.get("photo") or "https://cdn.jsdelivr.net/gh/MaiEden/pic-DB-events-app@main/dfault.png"
+        if self._img.property("img_url") != normalize_url(url):
+            self._img.clear()  # don't show the previous decor's photo meanwhile
+            load_into(self._img, url, size=QSize(420, 160))
+
+        self._title.setText(vm.get("title", ""))
+        self._subtitle.setText(vm.get("subtitle", ""))
+        self._price.setText(vm.get("price", ""))
+        self._region.setText(vm.get("region") or "")
+
+        available = bool(vm.get("available"))
+        self._pill.setText("Available" if available else "Unavailable")
+        if self._pill.property("ok") != available:
+            self._pill.setProperty("ok", available)
+            self._pill.setStyle(self._pill.style())
 
     def mouseReleaseEvent(self, e):
         if e.button() == Qt.LeftButton:
@@ -115,7 +106,11 @@ class DecorListView(QWidget):
         super().__init__()
         self.setWindowTitle("Decorations Catalog")
         self._cards_cache: List[Dict] = []
+        # one hover animation shared by all cards; retargeted on enter/leave
+        self._hover_anim = make_hover_anim(self)
         self._build()
+        # diffs each new card list against the shown one and reuses card widgets
+        self._card_grid = CardGrid(self.grid, self._new_card, self._columns)
         self._load_qss()
 
     def showEvent(self, e):
@@ -166,9 +161,9 @@ class DecorListView(QWidget):
         root.addWidget(self.empty)
 
     def _load_qss(self):
-        qss_path = Path(__file__).resolve().parent.parent / "style&icons" / "list_style.qss"
-        if qss_path.exists():
-            self.setStyleSheet(qss_path.read_text(encoding="utf-8"))
+        qss = read_qss(LIST_QSS)
+        if qss:
+            self.setStyleSheet(qss)
 
     # ---------- Presenter API ----------
     def set_busy(self, busy: bool):
@@ -201,34 +196,26 @@ class DecorListView(QWidget):
         if self._cards_cache:
             self._rebuild_grid()
 
-    # Responsive grid: number of columns based on viewport width
     def _rebuild_grid(self):
-        # clear
-        while self.grid.count():
-            it = self.grid.takeAt(0)
-            w = it.widget()
-            if w:
-                w.setParent(None)
-
-        if not self._cards_cache:
-            self.empty.setVisible(True)
-            return
-        self.empty.setVisible(False)
+        # suspend painting so the whole refill costs one relayout/paint
+        wrap = self.scroll.widget()
+        wrap.setUpdatesEnabled(False)
+        try:
+            self._sync_grid()
+        finally:
+            wrap.setUpdatesEnabled(True)
 
+    # Responsive grid: number of columns based on viewport width
+    def _columns(self) -> int:
         viewport_w = self.scroll.viewport().contentsRect().width()
         card_w = 340
-        cols = max(1, viewport_w // card_w)
-
-        r = c = 0
-        for vm in self._cards_cache:
-            card = DecorCard(vm)
-            card.clicked.connect(lambda _id, v=vm: self.cardClicked.emit(int(v.get("id") or -1)))
-            self.grid.addWidget(card, r, c)
-            c += 1
-            if c >= cols:
-                r += 1
-                c = 0
-
-        # vertical spacer to pin cards to top
-        self.grid.addItem(QSpacerItem(0, 0, QSizePolicy.Minimum, QSizePolicy.Expanding), r + 1, 0, 1, cols)
-        self.grid.setRowStretch(r + 1, 1)
\ No newline at end of file
+        return max(1, viewport_w // card_w)
+
+    def _sync_grid(self):
+        cards = self._card_grid.sync(self._cards_cache)
+        self.empty.setVisible(not cards)
+
+    def _new_card(self, vm: Dict) -> DecorCard:
+        card = DecorCard(vm, self._hover_anim)
+        card.clicked.connect(self.cardClicked)
+        return card
@@ -7,12 +7,15 @@ class HallDetailsPresenter(QObject):
         super().__init__()
         self.model = model
         self.view = view
+        self.bound_id = None  # id the page shows; None after a failed load
 
     def start(self, hall_id: int):
         self.view.set_busy(True)
+        self.bound_id = hall_id
         try:
             row = self.model.fetch(hall_id) or {}
         except Exception as e:
+            self.bound_id = None
             self.view.show_error(str(e))
             self.view.set_busy(False)
             return
@@ -1,15 +1,25 @@
 """
 Model: Fetches halls catalog from the server (no local fallbacks).
 Expected response: list[dict] with keys aligned to dbo.Hall columns.
+Type / accessibility filters are answered from an index built on load; free-text
+search is done by the server (SQL) off the GUI thread, with a small LRU of
+recent queries.
 """
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
 from UI import server_access
-from server.database.image_loader import IMAGE_LOADER
-from PySide6.QtCore import Qt
 
 class HallListModel:
+    # How many distinct (search, type, accessible) results to remember
+    QUERY_CACHE_SIZE = 32
+
     def __init__(self) -> None:
         self._items: List[Dict[str, Any]] = []
+        self._types: List[str] = []
+        # Facet index over _items: HallType -> row positions, and accessible positions
+        self._by_type: Dict[str, List[int]] = {}
+        self._accessible: List[int] = []
+        self._query_cache: "OrderedDict[Tuple[str, str, bool], List[Dict[str, Any]]]" = OrderedDict()
 
     # --- data fetch ---
     def load(self) -> None:
@@ -18,36 +28,106 @@ class HallListModel:
         if not isinstance(data, list):
             raise TypeError("Halls list endpoint must return a list of objects.")
         self._items = data
+        self._build_index()
+        self._query_cache.clear()  # fresh data → drop memoized filter results
+
+    def _build_index(self) -> None:
+        """One pass over the catalog: facet index + distinct types for the filter combo."""
+        by_type: Dict[str, List[int]] = {}
+        accessible: List[int] = []
+        for i, r in enumerate(self._items):
+            ht = r.get("HallType")
+            if ht:
+                by_type.setdefault(ht, []).append(i)
+            if r.get("WheelchairAccessible"):
+                accessible.append(i)
+        self._by_type = by_type
+        self._accessible = accessible
+        self._types = sorted(by_type)
 
     # --- queries on fetched data ---
     def all(self) -> List[Dict[str, Any]]:
         return list(self._items)
 
+    def types(self) -> List[str]:
+        """Distinct hall types of the loaded catalog (sorted)."""
+        return list(self._types)
+
     def query(
         self,
         text: str = "",
         hall_type: Optional[str] = None,
         accessible_only: bool = False,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Filter results that can be answered without the network: facet-only
+        queries from the local index, text searches from the memo of recent
+        server results. Returns None when the server has to be asked (search()).
+        """
+        t, ht, acc = self._normalize(text, hall_type, accessible_only)
+
+        # No text → answer from the facet index (no network, no full scan)
+        if not t:
+            return self._from_index(ht, acc)
+
+        key = (t.lower(), ht, acc)
+        rows = self._query_cache.get(key)
+        if rows is None:
+            return None
+        self._query_cache.move_to_end(key)
+        return list(rows)
+
+    def search(
+        self,
+        text: str,
+        hall_type: Optional[str] = None,
+        accessible_only: bool = False,
     ) -> List[Dict[str, Any]]:
-        """Client-side search & filter on already-fetched items."""
-        t = (text or "").strip().lower()
+        """
+        Text search done by the server (SQL). Blocking and stateless, so the
+        presenter runs it on the thread pool; hand the rows to remember().
+        """
+        t, ht, acc = self._normalize(text, hall_type, accessible_only)
+        params: Dict[str, Any] = {"search": t}
+        if ht:
+            params["hall_type"] = ht
+        if acc:
+            params["accessible"] = "true"
+        rows = server_access.request("/DB/halls/list", params=params)
+        if not isinstance(rows, list):
+            raise TypeError("Halls list endpoint must return a list of objects.")
+        return rows
+
+    def remember(
+        self,
+        text: str,
+        hall_type: Optional[str],
+        accessible_only: bool,
+        rows: List[Dict[str, Any]],
+    ) -> None:
+        """Memoize a search() result (GUI thread) so query() can answer it next time."""
+        t, ht, acc = self._normalize(text, hall_type, accessible_only)
+        self._query_cache[(t.lower(), ht, acc)] = rows
+        if len(self._query_cache) > self.QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
+
+    @staticmethod
+    def _normalize(text: str, hall_type: Optional[str], accessible_only: bool) -> Tuple[str, str, bool]:
+        t = (text or "").strip()
         ht = (hall_type or "").strip()
+        if ht == "All":
+            ht = ""
+        return t, ht, bool(accessible_only)
 
-        def match(item: Dict[str, Any]) -> bool:
-            if accessible_only and not bool(item.get("WheelchairAccessible")):
-                return False
-            if ht and ht != "All" and item.get("HallType") != ht:
-                return False
-            if not t:
-                return True
-            hay = " ".join(
-                [
-                    str(item.get("HallName", "")),
-                    str(item.get("Description", "")),
-                    str(item.get("HallType", "")),
-                    str(item.get("Region", "")),
-                ]
-            ).lower()
-            return t in hay
-
-        return [x for x in self._items if match(x)]
\ No newline at end of file
+    def _from_index(self, hall_type: str, accessible_only: bool) -> List[Dict[str, Any]]:
+        """Rows matching the type/accessibility facets, in catalog order."""
+        if not (hall_type or accessible_only):
+            return list(self._items)
+        if hall_type:
+            idx = self._by_type.get(hall_type, [])
+            if accessible_only:
+                acc = set(self._accessible)
+                idx = [i for i in idx if i in acc]
+        else:
+            idx = self._accessible
+        return [self._items[i] for i in idx]
@@ -3,15 +3,24 @@ Presenter: ties View <-> Model (MVP)
 - Wires search, hall_type, accessibility, refresh
 - Maps data rows to card view models (subset only)
 """
+from functools import partial
 from typing import Dict, Any
-from PySide6.QtCore import QObject
-from hall_list_model import HallListModel
+from PySide6.QtCore import QObject, Qt, QThreadPool
+from UI.server_access import Fetcher, FetchSignals
+from .hall_list_model import HallListModel
 
 class HallListPresenter(QObject):
     def __init__(self, model: HallListModel, view) -> None:
         super().__init__()
         self.model = model
         self.view = view
+        # Card view-models built once per load, reused on every filter change
+        self._cards_by_id: Dict[Any, Dict[str, Any]] = {}
+        # Text searches go to the server on the pool; only the latest one is shown
+        self._search_seq = 0
+        self._search = FetchSignals(self)
+        self._search.finished.connect(self._on_searched, Qt.QueuedConnection)
+        self._search.failed.connect(self._on_search_failed, Qt.QueuedConnection)
         self._connect()
 
     def _connect(self) -> None:
@@ -30,9 +39,11 @@ class HallListPresenter(QObject):
             self.view.set_busy(False)
             return
 
-        # hall types (distinct from data)
-        types = sorted({r.get("HallType") for r in self.model.all() if r.get("HallType")})
-        self.view.populate_types(["All"] + types)
+        rows = self.model.all()
+        self._cards_by_id = {r.get("HallId"): self._to_card(r) for r in rows}
+
+        # hall types (distinct values precomputed by the model on load)
+        self.view.populate_types(["All"] + self.model.types())
         self._apply_filters()
         self.view.set_busy(False)
 
@@ -48,8 +59,30 @@ class HallListPresenter(QObject):
         q = self.view.get_search_text()
         ht = self.view.get_selected_type()
         acc = self.view.get_accessible_only()
+        self._search_seq += 1  # any pending search is now stale
         rows = self.model.query(q, ht, acc)
-        cards = [self._to_card(r) for r in rows]
+        if rows is not None:
+            self._show_rows(rows)
+            return
+        # Not answerable locally → ask the server without blocking the UI
+        tag = (self._search_seq, q, ht, acc)
+        QThreadPool.globalInstance().start(
+            Fetcher(partial(self.model.search, q, ht, acc), self._search, tag)
+        )
+
+    def _on_searched(self, tag, rows) -> None:
+        seq, q, ht, acc = tag
+        if seq != self._search_seq or self.view is None:
+            return  # superseded by a newer filter change (or presenter disposed)
+        self.model.remember(q, ht, acc, rows)
+        self._show_rows(rows)
+
+    def _on_search_failed(self, tag, message: str) -> None:
+        if tag[0] == self._search_seq and self.view is not None:
+            self.view.show_error(message)
+
+    def _show_rows(self, rows) -> None:
+        cards = [self._cards_by_id.get(r.get("HallId")) or self._to_card(r) for r in rows]
         self.view.show_cards(cards)
 
     def _fmt_price(self, r: Dict[str, Any]) -> str:
@@ -5,41 +5,40 @@ View: Modern card grid + search/type/accessibility filters for Halls
 """
 from pathlib import Path
 from typing import Optional, List, Dict
-from PySide6.QtCore import Qt, QSize, Signal, QPropertyAnimation, QEasingCurve, QRect, QTimer
+from PySide6.QtCore import Qt, QSize, Signal, QPropertyAnimation, QRect, QTimer
+from PySide6.QtGui import QCursor
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QComboBox, QCheckBox,
-    QPushButton, QScrollArea, QFrame, QGridLayout, QSizePolicy, QSpacerItem,
-    QMessageBox, QGraphicsDropShadowEffect)
-from server.database.image_loader import load_into
+    QPushButton, QScrollArea, QFrame, QGridLayout, QSizePolicy, QMessageBox)
+from server.database.image_loader import load_into, normalize_url
+from UI.ui_helpers import read_qss, LIST_QSS, HoverCardMixin, make_hover_anim, CardGrid
 
 BASE_DIR = Path(__file__).resolve().parent
 
-def _apply_shadow(widget, radius=18, x_offset=0, y_offset=6):
-    """Apply a soft drop-shadow for subtle elevation."""
-    eff = QGraphicsDropShadowEffect(widget)
-    eff.setBlurRadius(radius)
-    eff.setOffset(x_offset, y_offset)
-    widget.setGraphicsEffect(eff)
-
-class HallCard(QFrame):
+class HallCard(HoverCardMixin, QFrame):
     """A single hall card widget; emits `clicked(id)` when pressed."""
     clicked = Signal(int)
 
-    def __init__(self, vm: Dict):
+    # Shared per-class constants (avoid rebuilding them for every card)
+    _MIN_SIZE = QSize(300, 270)
+    _FIXED_POLICY = QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+    _CURSOR = QCursor(Qt.PointingHandCursor)
+
+    def __init__(self, vm: Dict, hover_anim: Optional[QPropertyAnimation] = None):
+        """
+        vm: card view-model dict.
+        hover_anim: shared geometry animation owned by the list view; when omitted
+        the card creates its own (e.g. when used standalone).
+        """
         super().__init__(objectName="Card")
         self.vm = vm
-        self.setCursor(Qt.PointingHandCursor)
+        self.setCursor(HallCard._CURSOR)
         self.setMouseTracking(True)
-        self.setMinimumSize(300, 270)
-        self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-        _apply_shadow(self, radius=18, y_offset=6)
-
-        # Hover animation (grow/shrink the geometry a few pixels)
-        self._base_geom: Optional[QRect] = None
-        self._anim = QPropertyAnimation(self, b"geometry", self)
-        self._anim.setDuration(140)
-        self._anim.setEasingCurve(QEasingCurve.OutCubic)
-        self._grow_px = 8
+        self.setMinimumSize(HallCard._MIN_SIZE)
+        self.setSizePolicy(HallCard._FIXED_POLICY)
+        self.setProperty("flat", True)  # no drop-shadow effect; QSS border instead
+        self._init_hover(hover_anim)
+        self._img_url: Optional[str] = None
 
         self._build()
 
@@ -55,54 +54,65 @@ class HallCard(QFrame):
         img.setAlignment(Qt.AlignCenter)
         self._img = img
 
-        # URL from VM or default placeholder
-        url = self.vm.get("photo") or "https://cdn.jsdelivr.net/gh/MaiEden/pic-DB-events-app@main/dfault.png"
-        load_into(img, url, size=QSize(420, 160))
-
         # Textual metadata
-        title = QLabel(self.vm.get("title", ""), objectName="CardTitle")
-        subtitle = QLabel(self.vm.get("subtitle", ""), objectName="CardSubtitle")
+        self._title = QLabel(objectName="CardTitle")
+        self._subtitle = QLabel(objectName="CardSubtitle")
 
         # Bottom meta row: price | region | accessibility pill
         meta = QHBoxLayout()
-        price = QLabel(self.vm.get("price", ""), objectName="Price")
-        region = QLabel(self.vm.get("region") or "", objectName="Region")
-        pill = QLabel("Accessible" if self.vm.get("accessible") else "Not accessible", objectName="Pill")
-        pill.setProperty("ok", bool(self.vm.get("accessible")))  # used by QSS to style pill state
+        self._price = QLabel(objectName="Price")
+        self._region = QLabel(objectName="Region")
+        self._pill = QLabel(objectName="Pill")
 
-        meta.addWidget(price)
+        meta.addWidget(self._price)
         meta.addStretch(1)
-        meta.addWidget(region)
-        meta.addWidget(pill)
+        meta.addWidget(self._region)
+        meta.addWidget(self._pill)
 
         lay.addWidget(img)
         lay.addSpacing(6)
-        lay.addWidget(title)
-        lay.addWidget(subtitle)
+        lay.addWidget(self._title)
+        lay.addWidget(self._subtitle)
         lay.addLayout(meta)
 
-    # --- Hover grow/shrink ---
-    def enterEvent(self, e):
-        """On hover: animate a gentle grow from the current geometry."""
-        if self._base_geom is None:
-            self._base_geom = self.geometry()
-        g = self._base_geom
-        grow = self._grow_px
-        target = QRect(g.x() - grow // 2, g.y() - grow // 2, g.width() + grow, g.height() + grow)
-        self._anim.stop()
-        self._anim.setStartValue(self.geometry())
-        self._anim.setEndValue(target)
-        self._anim.start()
-        super().enterEvent(e)
-
-    def leaveEvent(self, e):
-        """On hover leave: animate back to the base geometry."""
-        if self._base_geom is not None:
-            self._anim.stop()
-            self._anim.setStartValue(self.geometry())
-            self._anim.setEndValue(self._base_geom)
-            self._anim.start()
-        super().leaveEvent(e)
+        self._apply_vm()
+
+    def ensure_image(self):
+        """Start loading the photo if it isn't already shown/requested (called when scrolled into view)."""
+        if self._img.property("img_url") != self._img_url:
+            load_into(self._img, self._img_url, size=QSize(420, 160))
+
+    def update_vm(self, vm: Dict):
+        """Rebind this card to another view-model (used when recycling cards)."""
+        if vm is self.vm or vm == self.vm:
+            return
+        self.vm = vm
+        self._apply_vm()
+
+    def _apply_vm(self):
+        """Push the current view-model into the card's widgets."""
+        vm = self.vm
+
+        # URL from VM or default placeholder, normalized the way load_into() stores
+        # it in "img_url" (so the checks below match); fetched lazily by ensure_image()
+        url = normalize_url(vm.get("photo") or "https://cdn.jsdelivr.net/gh/MaiEden/pic-DB-events-app@main/dfault.png")
+        if url != self._img_url:
+            self._img_url = url
+            if self._img.property("img_url") != url:
+                # Don't show (or later receive) the previous hall's photo while recycled
+                self._img.setProperty("img_url", None)
+                self._img.clear()
+
+        self._title.setText(vm.get("title", ""))
+        self._subtitle.setText(vm.get("subtitle", ""))
+        self._price.setText(vm.get("price", ""))
+        self._region.setText(vm.get("region") or "")
+
+        accessible = bool(vm.get("accessible"))
+        self._pill.setText("Accessible" if accessible else "Not accessible")
+        if self._pill.property("ok") != accessible:
+            self._pill.setProperty("ok", accessible)  # used by QSS to style pill state
+            self._pill.setStyle(self._pill.style())
 
     # --- Click handling ---
     def mouseReleaseEvent(self, e):
@@ -129,7 +139,11 @@ class HallListView(QWidget):
         self.setWindowTitle("Halls Catalog")
         self.resize(1120, 720)
         self._cards_cache: List[Dict] = []
+        # One hover animation shared by all cards; retargeted on enter/leave
+        self._hover_anim = make_hover_anim(self)
         self._build()
+        # Diffs each new card list against the rendered one and reuses card widgets
+        self._card_grid = CardGrid(self.grid, self._new_card, self._columns)
         self._load_qss()
 
     def showEvent(self, e):
@@ -146,7 +160,12 @@ class HallListView(QWidget):
         # Toolbar (search + filters + refresh)
         bar = QHBoxLayout()
         self.search = QLineEdit(placeholderText="Search by name, type or region…")
-        self.search.textChanged.connect(lambda s: self.searchChanged.emit(s))
+        # Coalesce keystrokes: only the text after a short pause reaches the presenter
+        self._search_debounce = QTimer(self)
+        self._search_debounce.setSingleShot(True)
+        self._search_debounce.setInterval(150)
+        self._search_debounce.timeout.connect(lambda: self.searchChanged.emit(self.search.text()))
+        self.search.textChanged.connect(lambda _s: self._search_debounce.start())
 
         self.hall_type = QComboBox()
         self.hall_type.currentTextChanged.connect(lambda s: self.typeChanged.emit(s))
@@ -175,6 +194,8 @@ class HallListView(QWidget):
         self.grid.setVerticalSpacing(16)
         self.scroll.setWidget(wrap)
         root.addWidget(self.scroll)
+        # Images are only loaded for cards near the viewport
+        self.scroll.verticalScrollBar().valueChanged.connect(self._load_visible_images)
 
         # Empty-state label (shown when no cards)
         self.empty = QLabel("No results", alignment=Qt.AlignCenter)
@@ -183,11 +204,10 @@ class HallListView(QWidget):
 
     # set stylesheet from external QSS file
     def _load_qss(self):
-        """Load and apply external QSS if available (keeps styling out of code)."""
-        from pathlib import Path
-        qss_path = Path(__file__).resolve().parent.parent / "style&icons" / "list_style.qss"
-        if qss_path.exists():
-            self.setStyleSheet(qss_path.read_text(encoding="utf-8"))
+        """Apply the external QSS if available (read from disk only once per process)."""
+        qss = read_qss(LIST_QSS)
+        if qss:
+            self.setStyleSheet(qss)
 
     # ---------- Presenter API ----------
     def set_busy(self, busy: bool):
@@ -228,38 +248,40 @@ class HallListView(QWidget):
         if self._cards_cache:
             self._rebuild_grid()
 
-    # Responsive grid: number of columns based on viewport width
-    def _rebuild_grid(self):
-        """Lay out HallCard widgets in N columns derived from the scroll viewport width."""
-        # Clear existing items/widgets from the grid
-        while self.grid.count():
-            it = self.grid.takeAt(0)
-            w = it.widget()
-            if w:
-                w.setParent(None)
-
-        # Empty-state handling
-        if not self._cards_cache:
-            self.empty.setVisible(True)
-            return
-        self.empty.setVisible(False)
-
-        # Determine how many columns fit the current viewport
+    def _columns(self) -> int:
+        """Responsive grid: how many cards fit side by side in the current viewport."""
         viewport_w = self.scroll.viewport().contentsRect().width()
         card_w = 340  # nominal card width used for column calculation
-        cols = max(1, viewport_w // card_w)
-
-        # Add cards row-by-row
-        r = c = 0
-        for vm in self._cards_cache:
-            card = HallCard(vm)
-            card.clicked.connect(lambda _id, v=vm: self.cardClicked.emit(int(v.get("id") or -1)))
-            self.grid.addWidget(card, r, c)
-            c += 1
-            if c >= cols:
-                r += 1
-                c = 0
-
-        # Vertical spacer to keep cards pinned to the top
-        self.grid.addItem(QSpacerItem(0, 0, QSizePolicy.Minimum, QSizePolicy.Expanding), r + 1, 0, 1, cols)
-        self.grid.setRowStretch(r + 1, 1)
\ No newline at end of file
+        return max(1, viewport_w // card_w)
+
+    def _rebuild_grid(self):
+        """Sync the grid with painting suspended so Qt does a single relayout/paint at the end."""
+        wrap = self.scroll.widget()
+        wrap.setUpdatesEnabled(False)
+        try:
+            self._sync_grid()
+        finally:
+            wrap.setUpdatesEnabled(True)
+        # Card geometries settle after the layout pass
+        QTimer.singleShot(0, self._load_visible_images)
+
+    def _sync_grid(self):
+        """Update the grid to the current cards (see CardGrid) and the empty state."""
+        cards = self._card_grid.sync(self._cards_cache)
+        self.empty.setVisible(not cards)
+
+    def _load_visible_images(self, *_args):
+        """Load photos only for cards intersecting the viewport (plus one row of look-ahead)."""
+        vp = self.scroll.viewport()
+        top = self.scroll.verticalScrollBar().value()
+        ahead = HallCard._MIN_SIZE.height()
+        visible = QRect(0, top - ahead, vp.width(), vp.height() + 2 * ahead)
+        for card in self._card_grid.cards:
+            if card.geometry().intersects(visible):
+                card.ensure_image()
+
+    def _new_card(self, vm: Dict) -> HallCard:
+        """Create a card wired to `cardClicked` (CardGrid pools and reuses it afterwards)."""
+        card = HallCard(vm, self._hover_anim)
+        card.clicked.connect(self.cardClicked)
+        return card
@@ -3,18 +3,137 @@ Model: business/data logic layer
 - Provides a simple credential check
 - In real apps, replace with DB/API + hashed passwords
 """
+import hashlib
+import hmac
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 from UI import server_access
 
+try:
+    import bcrypt  # optional: only needed once user records store bcrypt hashes
+except ImportError:
+    bcrypt = None
+
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+# Key for the in-memory verdict tokens; random per process unless pinned via env
+_SECRET = os.environ.get("EVENTPLANNER_AUTH_SECRET", "").encode("utf-8") or os.urandom(32)
+
+def _sha256(text: str) -> bytes:
+    """SHA-256 digest of a UTF-8 string."""
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+def _token(username: str, password: str) -> bytes:
+    """Keyed HMAC-SHA256 of the credential pair; one fixed-size key per (user, password)."""
+    # Length prefix keeps "a:b"/"c" and "a"/"b:c" from producing the same message
+    msg = f"{len(username)}:{username}:{password}".encode("utf-8")
+    return hmac.new(_SECRET, msg, hashlib.sha256).digest()
+
 class AuthModel:
+    # Seconds a fetched user record is reused for repeated sign-in attempts
+    USER_TTL = 10.0
+    # Transient network failures are retried this many times in total
+    FETCH_ATTEMPTS = 3
+    RETRY_DELAY = 0.3
+    # A successful verification is remembered this long (seconds) / for this many
+    # users: enough to absorb repeated submits, short enough that a password
+    # changed or an account deleted on the server takes effect right away
+    VERDICT_TTL = 5.0
+    VERDICT_MAX = 512
+
+    def __init__(self) -> None:
+        # username -> (expires_at, user record); unknown users are not cached
+        self._user_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # username -> (_token(username, password), expires_at) of the last success;
+        # only keyed digests are kept, never plaintext
+        self._verdicts: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
 
     def verify(self, username: str, password: str) -> bool:
-        """Return True if credentials are valid; otherwise False."""
-        user = server_access.request(f"/DB/users/get_user_by_name/{username}")
+        """
+        Return True if credentials are valid; otherwise False.
+        Blocking (network + comparison) — called from the presenter's worker thread,
+        which is also where a slow hash check (e.g. bcrypt) would belong.
+        """
+        key = _token(username, password)
+        if self._has_verdict(username, key):
+            return True
+
+        ok = self._verify_uncached(username, password)
+        # Only successes are cached: a failed attempt must not lock out a fixed password
+        if ok:
+            self._verdicts[username] = (key, time.monotonic() + self.VERDICT_TTL)
+            self._verdicts.move_to_end(username)
+            if len(self._verdicts) > self.VERDICT_MAX:
+                self._verdicts.popitem(last=False)
+        else:
+            # The server said no: forget what we had for this user, so neither a
+            # cached verdict nor a cached record outlives a password change
+            self._verdicts.pop(username, None)
+            self._user_cache.pop(username, None)
+        return ok
+
+    def quick_verdict(self, username: str, password: str) -> Optional[bool]:
+        """
+        Non-blocking answer when no server call is needed: False for an empty
+        username/password, True for a still-valid cached success; otherwise None.
+        Cheap enough to call on the GUI thread.
+        """
+        if not username.strip() or not password:
+            return False
+        if self._has_verdict(username, _token(username, password)):
+            return True
+        return None
+
+    def _has_verdict(self, username: str, key: bytes) -> bool:
+        """True if `key` is the user's cached, still-valid successful verification."""
+        hit = self._verdicts.get(username)
+        if hit is None:
+            return False
+        if hit[1] <= time.monotonic():
+            self._verdicts.pop(username, None)
+            return False
+        return hmac.compare_digest(hit[0], key)
+
+    def _verify_uncached(self, username: str, password: str) -> bool:
+        """Check a password against the server's user record."""
+        user = self._get_user(username)
         if not user:
             return False
 
         stored_password = user['PasswordHash']
         if not stored_password:
             return False
-        # Compare the provided password with the stored password
-        return stored_password == password
\ No newline at end of file
+        if bcrypt is not None and stored_password.startswith(_BCRYPT_PREFIXES):
+            # The KDF runs in C and releases the GIL, so concurrent checks use separate cores
+            return bcrypt.checkpw(password.encode("utf-8"), stored_password.encode("utf-8"))
+        # Constant-time compare of fixed-size digests: timing leaks neither how much
+        # matched nor the stored password's length
+        return hmac.compare_digest(_sha256(stored_password), _sha256(password))
+
+    def _get_user(self, username: str) -> Optional[Dict[str, Any]]:
+        """Fetch a user record, reusing a recent result for the same username."""
+        now = time.monotonic()
+        hit = self._user_cache.get(username)
+        if hit is not None and hit[0] > now:
+            return hit[1]
+
+        user = self._fetch_user(username)
+        # A miss is not cached: a user who just signed up must be found right away
+        if user:
+            self._user_cache[username] = (now + self.USER_TTL, user)
+        else:
+            self._user_cache.pop(username, None)
+        return user
+
+    def _fetch_user(self, username: str) -> Optional[Dict[str, Any]]:
+        """Call the server, retrying connection errors/timeouts a few times."""
+        for attempt in range(self.FETCH_ATTEMPTS):
+            try:
+                return server_access.request(f"/DB/users/get_user_by_name/{username}")
+            except Exception as e:
+                if not server_access.is_transient(e) or attempt == self.FETCH_ATTEMPTS - 1:
+                    raise
+                time.sleep(self.RETRY_DELAY)
+        return None
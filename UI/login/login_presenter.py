@@ -3,8 +3,7 @@
 Presenter: mediates between View and Model
 """
 
-from typing import Optional
-from PySide6.QtCore import QObject, Signal, Slot, QThread, Qt
+from PySide6.QtCore import QObject, Signal, Slot, QRunnable, QThreadPool, QTimer, Qt
 from UI.login.login_model import AuthModel
 from UI.login.login_view import LoginView
 from UI.ui_helpers import start_button_loading, stop_button_loading
@@ -12,24 +11,35 @@ from UI.ui_helpers import start_button_loading, stop_button_loading
 DEMO_PASSWORD = "hash:noa"
 DEMO_USER = "Noa Hadad"
 
-class _LoginWorker(QObject):
-    """Worker that runs in a QThread and performs the sign-in verification."""
+class _LoginSignals(QObject):
+    """Signal bridge for _LoginRunnable (QRunnable is not a QObject)."""
     finished = Signal(bool)  # ok
 
-    def __init__(self, model: AuthModel, username: str, password: str):
+class _LoginRunnable(QRunnable):
+    """
+    Reusable pool task that performs the sign-in verification off the GUI thread.
+    Not auto-deleted: the presenter owns one instance and re-arms it per attempt.
+    """
+
+    def __init__(self, model: AuthModel, signals: _LoginSignals):
         super().__init__()
+        self.setAutoDelete(False)
         self._model = model
+        self._signals = signals
+        self._username = ""
+        self._password = ""
+
+    def set_credentials(self, username: str, password: str):
         self._username = username
         self._password = password
 
-    @Slot()
     def run(self):
-        """Execute the blocking verification logic off the GUI thread."""
+        """Execute the blocking verification logic on a pool thread."""
         try:
             ok = self._model.verify(self._username, self._password)
         except Exception:
             ok = False
-        self.finished.emit(ok)
+        self._signals.finished.emit(ok)
 
 class LoginPresenter(QObject):
     # Signal for moving to the main app after successful login
@@ -39,9 +49,13 @@ class LoginPresenter(QObject):
         super().__init__()
         self.model = model
         self.view = view
-        self._thread: Optional[QThread] = None
-        self._worker: Optional[_LoginWorker] = None
         self._pending_username: str = ""
+        self._in_flight = False  # a sign-in check is running; ignore further submits
+        # One signal bridge for all sign-in tasks; results are queued to the GUI thread
+        self._signals = _LoginSignals(self)
+        self._signals.finished.connect(self._on_finished, Qt.QueuedConnection)
+        # One task reused for every attempt (guarded by _in_flight)
+        self._runnable = _LoginRunnable(self.model, self._signals)
         self._connect_signals()
 
     def _connect_signals(self):
@@ -51,7 +65,12 @@ class LoginPresenter(QObject):
 
     @Slot()
     def on_sign_in(self):
-        """Start async sign-in flow: show loading, spawn thread, run worker."""
+        """Start async sign-in flow: show loading, run the check on the global thread pool."""
+        # The button is disabled while loading, but Enter in the fields can still fire
+        if self._in_flight:
+            return
+        self._in_flight = True
+
         # Loading state on the button (spinner + disable)
         start_button_loading(self.view.sign_in_btn, "loading...")
 
@@ -59,44 +78,22 @@ class LoginPresenter(QObject):
         password = self.view.get_password()
         self._pending_username = username
 
-        # If a previous thread is still around, attempt to stop it gracefully
-        if self._thread is not None:
-            try:
-                self._thread.quit()
-                self._thread.wait(100)
-            except Exception:
-                pass
-            self._thread = None
-            self._worker = None
-
-        # Create thread and worker
-        th = QThread(self)
-        th.setObjectName("LoginWorkerThread")
-        worker = _LoginWorker(self.model, username, password)
-        worker.moveToThread(th)
-
-        # When the thread starts -> run the work
-        th.started.connect(worker.run)
-
-        # When the work finishes:
-        # 1) Update the UI on the GUI thread (QueuedConnection)
-        worker.finished.connect(self._on_finished, Qt.QueuedConnection)
-        # 2) Quit the thread
-        worker.finished.connect(th.quit)
-        # 3) Clean up resources when the thread actually finishes
-        th.finished.connect(worker.deleteLater)
-        th.finished.connect(th.deleteLater)
-
-        # Hold references to avoid premature GC
-        self._thread = th
-        self._worker = worker
-
-        # Go
-        th.start()
+        # Answerable without the server (empty input / cached success) → skip the pool;
+        # still finish on the next loop turn so the view flow stays asynchronous
+        quick = self.model.quick_verdict(username, password)
+        if quick is not None:
+            QTimer.singleShot(0, lambda: self._on_finished(quick))
+            return
+
+        # Pool threads and the task object are both reused across clicks
+        self._runnable.set_credentials(username, password)
+        QThreadPool.globalInstance().start(self._runnable)
 
     @Slot(bool)
     def _on_finished(self, ok: bool):
         """Runs on the GUI thread (connected via QueuedConnection)."""
+        self._in_flight = False
+        self._runnable.set_credentials("", "")  # don't keep the password around
         stop_button_loading(self.view.sign_in_btn)
         self.print_result(ok)
 
@@ -107,10 +104,7 @@ class LoginPresenter(QObject):
         else:
             self.view.show_message("Invalid username or password.", status="error")
 
-        # Release references; actual objects are deleted via connections in on_sign_in
         self._pending_username = ""
-        self._worker = None
-        self._thread = None
 
     @Slot()
     def on_use_demo(self):
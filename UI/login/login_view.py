@@ -3,21 +3,15 @@ View: UI only
 """
 from pathlib import Path
 from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QIcon, QPixmap
+from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QLineEdit, QPushButton,
     QFrame, QHBoxLayout
 )
 
-BASE_DIR = Path(__file__).resolve().parents[1]   # .../UI
+from UI.ui_helpers import ShadowFrame, scaled_pixmap
 
-def apply_drop_shadow(widget, radius=18, x_offset=0, y_offset=6):
-    """Set Subtle, modern shadow on a widget."""
-    from PySide6.QtWidgets import QGraphicsDropShadowEffect
-    shadow = QGraphicsDropShadowEffect(widget)
-    shadow.setBlurRadius(radius)
-    shadow.setOffset(x_offset, y_offset)
-    widget.setGraphicsEffect(shadow)
+BASE_DIR = Path(__file__).resolve().parents[1]   # .../UI
 
 class LoginView(QWidget):
     """Login screen. Styling is in styles.qss."""
@@ -49,8 +43,6 @@ class LoginView(QWidget):
         layout.setContentsMargins(26, 26, 26, 26)
         layout.setSpacing(18)
 
-        apply_drop_shadow(self.card)
-
         # ----- Header: title+subtitle (left) and icon (right) -----
         header = QHBoxLayout()
         header.setSpacing(12)
@@ -69,13 +61,11 @@ class LoginView(QWidget):
         self.icon_label = QLabel()
         icon_size = 130
 
-        # Load icon from file
+        # Load icon from file (decoded and scaled once, shared via QPixmapCache)
         icon_path = BASE_DIR / "style&icons" / "EventPlannerLogo.png"
-        pix = QPixmap(icon_path)
+        pix = scaled_pixmap(icon_path, icon_size)
         if not pix.isNull():
-            self.icon_label.setPixmap(
-                pix.scaled(icon_size, icon_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            )
+            self.icon_label.setPixmap(pix)
 
         self.icon_label.setFixedSize(icon_size, icon_size)
         self.icon_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
@@ -124,7 +114,7 @@ class LoginView(QWidget):
 
         box = QVBoxLayout()
         box.addStretch(1)
-        box.addWidget(self.card, alignment=Qt.AlignHCenter)
+        box.addWidget(ShadowFrame(self.card), alignment=Qt.AlignHCenter)
         box.addStretch(1)
 
         root.addLayout(box)
@@ -158,20 +148,31 @@ class LoginView(QWidget):
         return self.password.text()
 
     def set_demo_credentials(self, u: str, p: str):
-        self.username.setText(u)
-        self.password.setText(p)
-        self._update_button_state()
+        # Demo credentials are non-empty constants: fill both fields without the
+        # per-field textChanged re-validation and just enable the button
+        for field, text in ((self.username, u), (self.password, p)):
+            field.blockSignals(True)
+            field.setText(text)
+            field.blockSignals(False)
+        self.sign_in_btn.setEnabled(True)
 
     def show_message(self, text: str, status: str):
         """Show inline message with 'ok' or 'error' status (affects QSS)."""
         self.message.setText(text)
-        self.message.setProperty("status", status) # Set status for styling
         self.message.setVisible(True)
-        # Refresh style to apply [status="..."] selectors
-        self.message.setStyle(self.message.style())
+        if status != self.message.property("status"):
+            self.message.setProperty("status", status) # Set status for styling
+            # Re-polish only this label so [status="..."] selectors apply
+            st = self.message.style()
+            st.unpolish(self.message)
+            st.polish(self.message)
 
     # ---------- private helpers ----------
     def _update_button_state(self):
         # Enable sign in button only if both fields are filled
-        can_submit = bool(self.get_username().strip()) and bool(self.get_password())
-        self.sign_in_btn.setDisabled(not can_submit)
\ No newline at end of file
+        user = self.username.text()
+        can_submit = bool(user) and not user.isspace() and bool(self.password.text())
+        # Runs per keystroke: only touch the button when the state flips. The button's
+        # own enabled flag is the previous state, so loading/demo paths can't make it stale
+        if self.sign_in_btn.isEnabled() != can_submit:
+            self.sign_in_btn.setEnabled(can_submit)
\ No newline at end of file
@@ -1,75 +1,116 @@
 # Entry point – Single window. Login -> (on success) MainShell.
 
+import hashlib
+import os
 import sys
 from pathlib import Path
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QApplication
 
-# Make sure packages import cleanly when running from project root
 BASE = Path(__file__).resolve().parent
-for p in [
-    BASE / "login",
-    BASE / "signup",
-    BASE / "halls_list",
-    BASE / "service_list",
-    BASE / "decorator_list",
-    BASE / "style&icons",
-]:
-    sys.path.append(str(p))
-
-from main_shell import AppWindow, MainShell
-from login.login_view import LoginView
-from login.login_presenter import LoginPresenter
-from login.login_model import AuthModel
-from signup.signup_view import SignUpView
-from signup.signup_presenter import SignUpPresenter
-from signup.signup_model import SignUpModel
+
+from UI.main_shell import AppWindow, MainShell
+from UI.login.login_view import LoginView
+from UI.login.login_presenter import LoginPresenter
+from UI.login.login_model import AuthModel
+from UI.signup.signup_view import SignUpView, prefetch_logo as prefetch_signup_logo
+from UI.signup.signup_presenter import SignUpPresenter
+from UI.signup.signup_model import SignUpModel
+from UI import server_access
+from server.database.image_loader import IMAGE_LOADER, IMAGE_CDN_URL
+
+def _user_cache_dir() -> Path:
+    """Per-user cache directory (LOCALAPPDATA on Windows, ~/.cache elsewhere)."""
+    base = os.getenv("LOCALAPPDATA")
+    return (Path(base) if base else Path.home() / ".cache") / "EventPlanner"
 
 def load_global_qss(app):
-    """Load app-wide styles."""
+    """
+    Load app-wide styles.
+    The concatenated sheet is cached in one file in the user cache dir, headed by
+    a hash of the source files' mtime/size; it is rewritten when that changes, so
+    later launches read a single ready-made file.
+    """
     qss_paths = [
-        BASE / "style&icons" / "UIstyle.qss",
-        BASE / "style&icons" / "list_style.qss",
+        p for p in (
+            BASE / "style&icons" / "UIstyle.qss",
+            BASE / "style&icons" / "list_style.qss",
+        ) if p.exists()
     ]
-    css = ""
-    for p in qss_paths:
-        if p.exists():
-            css += p.read_text(encoding="utf-8") + "\n"
+    sig = "|".join(f"{p}:{p.stat().st_mtime_ns}:{p.stat().st_size}" for p in qss_paths)
+    header = f"/* src {hashlib.sha1(sig.encode('utf-8')).hexdigest()} */\n"
+    cache = _user_cache_dir() / "global-qss.css"
+    try:
+        cached = cache.read_text(encoding="utf-8")
+    except OSError:
+        cached = ""
+    if cached.startswith(header):
+        css = cached[len(header):]
+    else:
+        css = "".join(p.read_text(encoding="utf-8") + "\n" for p in qss_paths)
+        try:
+            cache.parent.mkdir(parents=True, exist_ok=True)
+            cache.write_text(header + css, encoding="utf-8")
+            # Per-hash files written by older builds
+            for old in cache.parent.glob("qss-*.css"):
+                old.unlink(missing_ok=True)
+        except OSError:
+            pass  # read-only profile etc. — just skip caching
     app.setStyleSheet(css)
 
 def build_auth_flow(app_window: AppWindow):
-    """Create Login & SignUp pages and wire navigation + success route."""
-    # Views
+    """Create the Login page (SignUp is built on first visit) and wire navigation + success route."""
     login_view = LoginView()
-    signup_view = SignUpView()
 
     # Presenters (QObject!) — must keep references to avoid GC
     login_presenter = LoginPresenter(AuthModel(), login_view)
-    signup_presenter = SignUpPresenter(SignUpModel(), signup_view)
 
     # Keep them alive on the window
-    app_window.keep(login_presenter, signup_presenter, login_view, signup_view)
+    app_window.keep(login_presenter, login_view)
 
-    # Add pages
     app_window.add_page("login", login_view)
-    app_window.add_page("signup", signup_view)
+    # Sign-up is built lazily, but its logo can be decoded while the user is on login
+    prefetch_signup_logo()
+    # page name -> presenter, so the auth pages can be released once signed in
+    auth_presenters = {"login": login_presenter}
 
-    # View-to-view navigation
-    login_view.sign_up_clicked.connect(lambda: app_window.goto("signup"))
-    signup_view.cancel_clicked.connect(lambda: app_window.goto("login"))
+    # There is no way back to the auth pages after sign-in: free them (and their presenters)
+    def drop_auth_pages():
+        for name, presenter in list(auth_presenters.items()):
+            app_window.remove_page(name, presenter)
+        auth_presenters.clear()
 
     # On successful auth -> build/open shell inside same window
     def open_shell(username: str):
         shell = MainShell(username=username)
         app_window.set_shell(shell)
         app_window.goto("shell")
+        # Deferred: open_shell runs inside the presenter's auth_ok emission
+        QTimer.singleShot(0, drop_auth_pages)
+
+    # Most sessions never visit sign-up; build its view/presenter on first use
+    def goto_signup():
+        if not app_window.has_page("signup"):
+            signup_view = SignUpView()
+            signup_presenter = SignUpPresenter(SignUpModel(), signup_view)
+            app_window.keep(signup_presenter, signup_view)
+            auth_presenters["signup"] = signup_presenter
+            app_window.add_page("signup", signup_view)
+            signup_view.cancel_clicked.connect(lambda: app_window.goto("login"))
+            signup_presenter.auth_ok.connect(open_shell)
+        app_window.goto("signup")
 
+    # View-to-view navigation
+    login_view.sign_up_clicked.connect(goto_signup)
     login_presenter.auth_ok.connect(open_shell)
-    signup_presenter.auth_ok.connect(open_shell)
 
 
 def main():
     app = QApplication(sys.argv)
+    app.aboutToQuit.connect(server_access.close)
     load_global_qss(app)
+    # Warm up the image CDN connection while the user is on the login page
+    IMAGE_LOADER.preconnect(IMAGE_CDN_URL)
 
     win = AppWindow()
     build_auth_flow(win)
@@ -2,97 +2,70 @@
 # File: main_shell.py  (Halls + Services + Decors with Details)
 # ============================
 import sys
+from collections import OrderedDict
+from functools import partial
+from importlib import import_module
 from pathlib import Path
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPixmap, QIcon
+from PySide6.QtCore import Qt, QTimer, QSize, Signal
+from PySide6.QtGui import QPixmap, QIcon, QCursor, QPixmapCache
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QLabel, QVBoxLayout, QHBoxLayout,
-    QPushButton, QToolButton, QStackedWidget, QSizePolicy, QFrame
+    QPushButton, QToolButton, QStackedWidget, QSizePolicy, QFrame, QButtonGroup
 )
-from typing import Optional
+from typing import Callable, Optional
 
 APP_BASE = Path(__file__).resolve().parent
 PROJECT_ROOT = APP_BASE.parent  # WindowsAppProject/
-
-# Ensure subpackages are on sys.path (lists, details, style, agent, user, add_decor)
-for p in [
-    APP_BASE / "halls_list",
-    APP_BASE / "service_list",
-    APP_BASE / "decorator_list",
-    APP_BASE / "style&icons",
-    APP_BASE / "agent",
-    APP_BASE / "user_info",
-    APP_BASE / "add_decor",   # <- keep add_decor on path if needed
-]:
-    sys.path.append(str(p))
+_LOGO_PATH = APP_BASE / "style&icons" / "EventPlannerLogo.png"
 
 # ---------- Lists ----------
-from halls_list.hall_list_view import HallListView
-from halls_list.hall_list_model import HallListModel
-from halls_list.hall_list_presenter import HallListPresenter
-
-from service_list.service_list_view import ServiceListView
-from service_list.service_list_model import ServiceListModel
-from service_list.service_list_presenter import ServiceListPresenter
-
-from decorator_list.decor_list_view import DecorListView
-from decorator_list.decor_list_model import DecorListModel
-from decorator_list.decor_list_presenter import DecorListPresenter
-
-# ---------- Details ----------
-# Halls
-from halls_list.hall_details_view import HallDetailsView
-from halls_list.hall_details_model import HallDetailsModel
-from halls_list.hall_details_presenter import HallDetailsPresenter
-# Services
-from service_list.service_details_view import ServiceDetailsView
-from service_list.service_details_model import ServiceDetailsModel
-from service_list.service_details_presenter import ServiceDetailsPresenter
-# Decors
-from decorator_list.decor_details_view import DecorDetailsView
-from decorator_list.decor_details_model import DecorDetailsModel
-from decorator_list.decor_details_presenter import DecorDetailsPresenter
-
-# --- Chat MVP factory ---
-from agent.chat_factory import build_chat_module
-
-# User info module
-from user_info.user_info_view import UserInfoView
-from user_info.user_info_model import UserInfoModel
-from user_info.user_info_presenter import UserInfoPresenter
-
-# Decor price chart (MVP)
-from UI.graphs.decor_price_view import DecorPriceView
-from UI.graphs.decor_price_model import DecorPriceModel
-from UI.graphs.decor_price_presenter import DecorPricePresenter
-
-# --- Add Decor screen ---
-from UI.add_decor.add_decor_view import AddDecorView
-from UI.add_decor.add_decor_model import AddDecorModel
-from UI.add_decor.add_decor_presenter import AddDecorPresenter
+from UI.halls_list.hall_list_view import HallListView
+from UI.halls_list.hall_list_model import HallListModel
+from UI.halls_list.hall_list_presenter import HallListPresenter
+
+from UI.service_list.service_list_view import ServiceListView
+from UI.service_list.service_list_model import ServiceListModel
+from UI.service_list.service_list_presenter import ServiceListPresenter
+
+from UI.decorator_list.decor_list_view import DecorListView
+from UI.decorator_list.decor_list_model import DecorListModel
+from UI.decorator_list.decor_list_presenter import DecorListPresenter
+
+# Details, chat, profile, price chart and add-decor modules are imported inside the
+# factories that first need them (see _make_* / _show_price_chart / open_add_decor),
+# so their transitive imports stay off the shell-startup path.
+
+from UI.ui_helpers import scaled_pixmap_async, PIXMAP_CACHE_KB
 
 # ---------- Helpers ----------
+# Shared by every circle button (the look itself is one QToolButton#CircleBtn rule in UIstyle.qss)
+_CIRCLE_SIZE = QSize(40, 40)
+_HAND_CURSOR = QCursor(Qt.PointingHandCursor)
+_NAV_BTN_POLICY = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+
 def circle_icon_button(char: str, tooltip: str) -> QToolButton:
     """Round, ghost-style icon button using a unicode glyph (e.g. ◀ ▶)."""
-    b = QToolButton()
+    b = QToolButton(objectName="CircleBtn")
     b.setText(char)
     b.setToolTip(tooltip)
-    b.setCursor(Qt.PointingHandCursor)
+    b.setCursor(_HAND_CURSOR)
     b.setAutoRaise(True)
-    b.setFixedSize(40, 40)
-    b.setStyleSheet("""
-        QToolButton {
-            font-size: 18px; font-weight: 700;
-            border-radius: 20px;
-            border: 1px solid rgba(0,0,0,0.08);
-            background: rgba(255,255,255,0.6);
-        }
-        QToolButton:hover   { background: rgba(66,133,244,0.10); }
-        QToolButton:pressed { background: rgba(66,133,244,0.18); }
-        QToolButton:disabled{ opacity: .35; }
-    """)
+    b.setFixedSize(_CIRCLE_SIZE)
     return b
 
+class PlaceholderPage(QWidget):
+    """Simple page with a centered label (styled by QLabel#Placeholder)."""
+    def __init__(self, text: str = ""):
+        super().__init__()
+        lay = QVBoxLayout(self)
+        lay.addStretch(1)
+        self._label = QLabel(text, objectName="Placeholder", alignment=Qt.AlignCenter)
+        lay.addWidget(self._label)
+        lay.addStretch(1)
+
+    def setText(self, text: str):
+        self._label.setText(text)
+
 # ---------- AppWindow ----------
 class AppWindow(QMainWindow):
     """Top-level window that owns a stack of pages (login / signup / shell)."""
@@ -101,37 +74,89 @@ class AppWindow(QMainWindow):
         self.setWindowTitle("Event Planner – App")
         self.setWindowIcon(QIcon(str(APP_BASE / "style&icons" / "no_words_icon.png")))
         self.setMinimumSize(960, 640)
+        # One pixmap budget for icons/logos/thumbnails shared by every view
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), PIXMAP_CACHE_KB))
 
         self._stack = QStackedWidget()
         self.setCentralWidget(self._stack)
         self._pages: dict[str, QWidget] = {}
-        self._keepers: list[object] = []   # keep strong refs (presenters/views) to prevent GC
+        self._keepers: set[object] = set()   # strong refs (presenters/views) to prevent GC
         self._shell: Optional["MainShell"] = None
+        self._pending_delete: list[QWidget] = []  # retired pages, deleted together on idle
+        # Own size policies of pages parked behind the current one (see goto)
+        self._parked_policies: dict[QWidget, QSizePolicy] = {}
+
+    def keep(self, *objs): self._keepers.update(objs)
 
-    def keep(self, *objs): self._keepers.extend(objs)
+    def release(self, *objs): self._keepers.difference_update(objs)
 
     def add_page(self, name: str, widget: QWidget):
         self._pages[name] = widget
         self._stack.addWidget(widget)
 
+    def has_page(self, name: str) -> bool:
+        return name in self._pages
+
+    def remove_page(self, name: str, *owners):
+        """Drop a page for good; its widget is retired and `owners` (e.g. its presenter) released."""
+        widget = self._pages.pop(name, None)
+        if widget is None:
+            return
+        self._stack.removeWidget(widget)
+        self._parked_policies.pop(widget, None)
+        self.release(widget, *owners)
+        self._retire(widget)
+
     def set_shell(self, shell: "MainShell"):
         """Replace an existing shell page (if any) and register the new one."""
         if getattr(self, "_shell", None):
             self._stack.removeWidget(self._shell)
-            self._shell.deleteLater()
+            self._parked_policies.pop(self._shell, None)
+            self.release(self._shell)
+            self._shell.dispose()
+            self._retire(self._shell)
         self._shell = shell
         self.add_page("shell", shell)
         self.keep(shell)
 
+    def _retire(self, widget: QWidget):
+        """Queue a removed page for deletion; the batch is flushed on the next idle tick."""
+        widget.hide()
+        self._pending_delete.append(widget)
+        if len(self._pending_delete) == 1:
+            QTimer.singleShot(0, self._flush_deletes)
+
+    def _flush_deletes(self):
+        """deleteLater every retired page in one pass."""
+        pending, self._pending_delete = self._pending_delete, []
+        for w in pending:
+            w.deleteLater()
+
     def goto(self, name: str):
-        """Navigate to a registered page by name."""
+        """
+        Navigate to a registered page by name. The page being left gets an Ignored
+        size policy so the stack's size hints/relayouts only consider the current page.
+        """
         w = self._pages.get(name)
-        if w is not None:
-            self._stack.setCurrentWidget(w)
+        prev = self._stack.currentWidget()
+        if w is None or w is prev:
+            return
+        if prev is not None:
+            self._parked_policies[prev] = prev.sizePolicy()
+            prev.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
+        policy = self._parked_policies.pop(w, None)
+        if policy is not None:
+            w.setSizePolicy(policy)
+        self._stack.setCurrentWidget(w)
 
 # ---------- MainShell ----------
 class MainShell(QWidget):
     """Main application surface (after successful auth)."""
+    # Per-decor price chart pages kept alive for back/forward; older ones are disposed
+    CHART_PAGE_CACHE = 8
+    # Back/forward history depth
+    HISTORY_MAX = 128
+
     def __init__(self, username: str):
         super().__init__()
         self.setWindowTitle("Event Planner – App")
@@ -143,13 +168,22 @@ class MainShell(QWidget):
 
         # name -> widget mapping for center pages
         self._center_pages: dict[str, QWidget] = {}
+        # widget -> index in center_stack
+        self._stack_index: dict[QWidget, int] = {}
+        # kind -> (view, presenter) for the shared details pages
+        self._details: dict[str, tuple[QWidget, object]] = {}
+        # "decorprice:<id>" -> (view, presenter), most recently shown last
+        self._chart_lru: "OrderedDict[str, tuple[QWidget, object]]" = OrderedDict()
 
         # keep presenters alive (prevent GC)
         self._presenters: list[object] = []
+        # (signal, slot) pairs from pages into this shell, undone by _teardown
+        self._connections: list[tuple] = []
 
         # typed hints (kept as comments to avoid extra imports)
         self._user_presenter = None  # type: Optional[UserInfoPresenter]
         self._user_view = None       # type: Optional[UserInfoView]
+        self._placeholder_page: Optional[PlaceholderPage] = None
 
         self._build_ui()
         self._wire()
@@ -167,12 +201,14 @@ class MainShell(QWidget):
         top = QHBoxLayout(); top.setSpacing(10)
 
         logo = QLabel()
-        pm = QPixmap(str(APP_BASE / "style&icons" / "EventPlannerLogo.png"))
-        if not pm.isNull():
-            logo.setPixmap(pm.scaledToHeight(56, Qt.SmoothTransformation))
+        logo.setMinimumHeight(56)  # placeholder size until the pixmap arrives
+        # Decoded + scaled on the thread pool, once per process (QPixmapCache)
+        def set_logo(pm: QPixmap):
+            if not pm.isNull():
+                logo.setPixmap(pm)
+        scaled_pixmap_async(_LOGO_PATH, 56, set_logo, height_only=True)
 
-        title = QLabel(f"Welcome, {self.username}")
-        title.setStyleSheet("font-size:20px; font-weight:700;")
+        title = QLabel(f"Welcome, {self.username}", objectName="ShellTitle")
 
         self.back_btn = circle_icon_button("◀", "Back")
         self.fwd_btn  = circle_icon_button("▶", "Forward")
@@ -189,17 +225,19 @@ class MainShell(QWidget):
         mid = QHBoxLayout(); mid.setSpacing(10)
 
         side = QFrame(objectName="SidePanel")
+        side.setAttribute(Qt.WA_StyledBackground, True)  # panel background comes straight from QSS
         side_l = QVBoxLayout(side)
         side_l.setContentsMargins(12, 12, 12, 12)
         side_l.setSpacing(8)
+        side.setFixedWidth(220)  # fixed before children are added: one width for all layout passes
 
         def mkbtn(text: str, emoji: str) -> QPushButton:
             """Create a left-nav button with emoji, left-aligned text, and pressed state."""
             b = QPushButton(f"{emoji}  {text}", objectName="NavBtn")
             b.setMinimumHeight(44)
-            b.setCursor(Qt.PointingHandCursor)
+            b.setCursor(_HAND_CURSOR)
             b.setCheckable(True)
-            b.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+            b.setSizePolicy(_NAV_BTN_POLICY)
             return b
 
         self.btn_halls   = mkbtn("Halls",       "📅")
@@ -216,10 +254,15 @@ class MainShell(QWidget):
             ("profile", self.btn_profile),
             ("ai", self.btn_ai),
         ]
-        for _, b in self._nav_buttons:
+        # Exclusive group: checking one button unchecks the previous one inside Qt
+        self._nav_group = QButtonGroup(self)
+        self._nav_group.setExclusive(True)
+        for idx, (_, b) in enumerate(self._nav_buttons):
+            self._nav_group.addButton(b, idx)
             side_l.addWidget(b)
+        self._nav_btn_by_key: dict[str, QPushButton] = dict(self._nav_buttons)
+        self._active_nav_key: Optional[str] = None  # key of the checked button, None if none
         side_l.addStretch(1)
-        side.setFixedWidth(220)
 
         # Center area is a stacked widget that hosts each page
         self.center_stack = QStackedWidget()
@@ -229,27 +272,6 @@ class MainShell(QWidget):
         mid.addWidget(self.center_stack, 1)
         root.addLayout(mid, 1)
 
-        # Inline style for the left side panel and nav buttons
-        self.setStyleSheet("""
-            QFrame#SidePanel {
-                background:#fff;
-                border:1px solid rgba(0,0,0,0.07);
-                border-radius:14px;
-            }
-            QPushButton#NavBtn {
-                text-align:left;
-                padding:10px 14px;
-                border:none;
-                border-radius:10px;
-                font-size:14px;
-            }
-            QPushButton#NavBtn:hover:!checked { background:rgba(0,0,0,0.04); }
-            QPushButton#NavBtn:checked {
-                background:rgba(66,133,244,0.12);
-                border-left:3px solid rgb(66,133,244);
-                padding-left:11px; font-weight:600;
-            }
-        """)
         self._update_nav_buttons()
 
     def _wire(self):
@@ -257,59 +279,113 @@ class MainShell(QWidget):
         self.back_btn.clicked.connect(self.go_back)
         self.fwd_btn.clicked.connect(self.go_forward)
 
-        self.btn_halls.clicked.connect(lambda: self.navigate("halls"))
-        self.btn_services.clicked.connect(lambda: self.navigate("services"))
-        self.btn_decors.clicked.connect(lambda: self.navigate("decors"))
-        self.btn_profile.clicked.connect(lambda: self.navigate("profile"))
-        self.btn_ai.clicked.connect(lambda: self.navigate("ai"))
+        # One connection for all nav buttons: the group reports the clicked button's id
+        self._nav_group.idClicked.connect(self._on_nav_clicked)
+
+    def _on_nav_clicked(self, idx: int):
+        self.navigate(self._nav_buttons[idx][0])
 
     # ----- Microfrontends -----
     def _load_microfrontends(self):
-        """Instantiate list pages, details wiring, chat module, and profile page."""
-        # Halls list
+        """
+        Register a factory per top-level page. Pages (and their presenters' initial
+        data loads) are built on first navigation, not when the shell opens.
+        """
+        self._page_factories: dict[str, Callable[[], QWidget]] = {
+            "halls": self._make_halls,
+            "services": self._make_services,
+            "decors": self._make_decors,
+            "ai": self._make_ai,
+            "profile": self._make_profile,
+        }
+
+    def _link(self, signal, slot):
+        """Connect a page signal to a shell slot and remember it for _teardown."""
+        signal.connect(slot)
+        self._connections.append((signal, slot))
+
+    def _teardown(self):
+        """Disconnect page -> shell connections so pages stop referencing this shell."""
+        for signal, slot in self._connections:
+            try:
+                signal.disconnect(slot)
+            except (RuntimeError, TypeError):
+                pass  # sender already deleted / never connected
+        self._connections.clear()
+
+    def closeEvent(self, e):
+        self._teardown()
+        super().closeEvent(e)
+
+    def _ensure_page(self, name: str) -> bool:
+        """Build a registered page on first use; True if the page exists afterwards."""
+        if name in self._center_pages:
+            return True
+        factory = self._page_factories.pop(name, None)
+        if factory is None:
+            return False
+        self._register_center_page(name, factory())
+        return True
+
+    def _make_halls(self) -> QWidget:
         halls_v = HallListView()
         halls_p = HallListPresenter(HallListModel(), halls_v)
         halls_p.start()
         self._presenters.append(halls_p)
-        self._register_center_page("halls", halls_v)
-        halls_v.cardClicked.connect(self.open_hall_details)
+        self._link(halls_v.cardClicked, partial(self.open_details, "hall"))
+        return halls_v
 
-        # Services (list)
+    def _make_services(self) -> QWidget:
         svc_v = ServiceListView()
         svc_p = ServiceListPresenter(ServiceListModel(), svc_v)
         svc_p.start()
         self._presenters.append(svc_p)
-        self._register_center_page("services", svc_v)
-        svc_v.cardClicked.connect(self.open_service_details)
+        self._link(svc_v.cardClicked, partial(self.open_details, "service"))
+        self._link(svc_v.cardHovered, self._prefetch_service)
+        return svc_v
+
+    def _prefetch_service(self, service_id: int):
+        """Warm the service details cache for a hovered card (skipped if already shown)."""
+        page = self._details.get("service")
+        if service_id < 0 or (page is not None and page[1].bound_id == service_id):
+            return
+        from UI.service_list.service_details_model import ServiceDetailsModel
+        ServiceDetailsModel.prefetch(service_id)
 
-        # Decorations (list)
+    def _make_decors(self) -> QWidget:
         dec_v = DecorListView()
         dec_p = DecorListPresenter(DecorListModel(), dec_v)
         dec_p.start()
         self._presenters.append(dec_p)
-        self._register_center_page("decors", dec_v)
-        dec_v.cardClicked.connect(self.open_decor_details)
+        self._link(dec_v.cardClicked, partial(self.open_details, "decor"))
+        return dec_v
 
+    def _make_ai(self) -> QWidget:
         # AI (chat) – via factory (keeps settings out of this file)
+        from UI.agent.chat_factory import build_chat_module
         chat_v, chat_p = build_chat_module(PROJECT_ROOT, sys.executable)
         self._presenters.append(chat_p)
-        self._register_center_page("ai", chat_v)
+        return chat_v
 
+    def _make_profile(self) -> QWidget:
+        from UI.user_info.user_info_view import UserInfoView
+        from UI.user_info.user_info_model import UserInfoModel
+        from UI.user_info.user_info_presenter import UserInfoPresenter
         # User profile (real view instead of a placeholder)
         user_v = UserInfoView()
         user_p = UserInfoPresenter(UserInfoModel(), user_v)
         user_p.start(self.username)
         self._presenters.append(user_p)
-        self._register_center_page("profile", user_v)
 
         self._user_presenter = user_p
         self._user_view = user_v
 
         # '+' in Owned items opens the Add-Decor screen
-        user_v.addDecorClicked.connect(self.open_add_decor)
+        self._link(user_v.addDecorClicked, self.open_add_decor)
 
         # NEW: clicking the chart icon inside "Owned" opens the decor price chart
-        user_v.ownedGraphClicked.connect(self.open_decor_price_chart)
+        self._link(user_v.ownedGraphClicked, self.open_decor_price_chart)
+        return user_v
 
     # ----- Add-Decor opener -----
     def open_add_decor(self) -> None:
@@ -322,6 +398,9 @@ class MainShell(QWidget):
             self.navigate(page_name)
             return
 
+        from UI.add_decor.add_decor_view import AddDecorView
+        from UI.add_decor.add_decor_model import AddDecorModel
+        from UI.add_decor.add_decor_presenter import AddDecorPresenter
         view = AddDecorView()
         model = AddDecorModel()
 
@@ -329,7 +408,7 @@ class MainShell(QWidget):
             """Navigate back to Profile and refresh its data after a successful add."""
             self.navigate("profile")
             if self._user_presenter is not None:
-                self._user_presenter.start(self.username)
+                self._user_presenter.reload()
 
         presenter = AddDecorPresenter(
             model, view,
@@ -346,131 +425,147 @@ class MainShell(QWidget):
         self.navigate(page_name)
 
     def _placeholder(self, text: str) -> QWidget:
-        """Simple placeholder page with centered label."""
-        w = QWidget()
-        lay = QVBoxLayout(w)
-        lay.addStretch(1)
-        lbl = QLabel(text, alignment=Qt.AlignCenter)
-        lbl.setStyleSheet("font-size:16px; color:#666;")
-        lay.addWidget(lbl)
-        lay.addStretch(1)
-        return w
+        """Shared placeholder page with a centered label; built once, later calls just swap the text."""
+        if self._placeholder_page is None:
+            self._placeholder_page = PlaceholderPage(text)
+        else:
+            self._placeholder_page.setText(text)
+        return self._placeholder_page
+
+    # Stack indices are cached so page switches are setCurrentIndex, not an indexOf scan
+    def _stack_add(self, widget: QWidget):
+        self._stack_index[widget] = self.center_stack.addWidget(widget)
+
+    def _stack_remove(self, widget: QWidget):
+        """Remove a page; later pages shift down, so re-read the (rare) index map."""
+        self.center_stack.removeWidget(widget)
+        self._stack_index.pop(widget, None)
+        for w in self._stack_index:
+            self._stack_index[w] = self.center_stack.indexOf(w)
+
+    def _stack_show(self, widget: QWidget):
+        self.center_stack.setCurrentIndex(self._stack_index[widget])
 
     def _register_center_page(self, name: str, widget: QWidget):
         """Add a page to the center stack and index it by name."""
         self._center_pages[name] = widget
-        self.center_stack.addWidget(widget)
+        self._stack_add(widget)
 
     # ----- Details openers -----
-    def open_hall_details(self, hall_id: int):
-        """Open (or reuse) the hall details page for the given id."""
-        page_name = f"hall:{hall_id}"
-        if page_name in self._center_pages:
-            self.navigate(page_name); return
-        view = HallDetailsView()
-        presenter = HallDetailsPresenter(HallDetailsModel(), view)
-        presenter.start(hall_id)
-        self._presenters.append(presenter)   # prevent GC
-        self._register_center_page(page_name, view)
-        self.navigate(page_name)
-
-    def open_service_details(self, service_id: int):
-        """Open (or reuse) the service details page for the given id."""
-        page_name = f"service:{service_id}"
-        if page_name in self._center_pages:
-            self.navigate(page_name); return
-        view = ServiceDetailsView()
-        presenter = ServiceDetailsPresenter(ServiceDetailsModel(), view)
-        presenter.start(service_id)
-        self._presenters.append(presenter)   # prevent GC
-        self._register_center_page(page_name, view)
-        self.navigate(page_name)
-
-    def open_decor_details(self, decor_id: int):
-        """Open (or reuse) the decor details page for the given id."""
-        page_name = f"decor:{decor_id}"
-        if page_name in self._center_pages:
-            self.navigate(page_name); return
-        view = DecorDetailsView()
-        presenter = DecorDetailsPresenter(DecorDetailsModel(), view)
-        presenter.start(decor_id)
-        self._presenters.append(presenter)   # prevent GC
-        self._register_center_page(page_name, view)
-        self.navigate(page_name)
-
-    # ----- Add-Decor opener -----
-    def open_add_decor(self) -> None:
-        """Open the Add-Decor page (duplicate definition kept intentionally)."""
-        page_name = "add_decor"
-        if page_name in self._center_pages:
-            view = self._center_pages[page_name]
-            if hasattr(view, "reset_form"):
-                view.reset_form()
-            self.navigate(page_name)
-            return
-
-        view = AddDecorView()
-        model = AddDecorModel()
-
-        def back_to_profile() -> None:
-            # navigate back and refresh the profile data
-            self.navigate("profile")
-            if self._user_presenter is not None:
-                self._user_presenter.start(self.username)
-
-        presenter = AddDecorPresenter(
-            model, view,
-            current_username=self.username,
-            on_success=back_to_profile
-        )
-        presenter.start()
-
-        # optional: cancel goes back without creating
-        if hasattr(view, "cancelRequested"):
-            view.cancelRequested.connect(back_to_profile)
-
-        self._presenters.append(presenter)
-        self._register_center_page(page_name, view)    # register into the stack
-        self.navigate(page_name)
-
-
-# ----- Navigation helpers -----
+    # kind -> (package, module prefix, class prefix) of its details MVP, imported on first open.
+    # Each kind has ONE details page that is re-bound to the requested id; history keeps
+    # "kind:id" routes so back/forward still work.
+    _DETAIL_KINDS = {
+        "hall": ("UI.halls_list", "hall_details", "HallDetails"),
+        "service": ("UI.service_list", "service_details", "ServiceDetails"),
+        "decor": ("UI.decorator_list", "decor_details", "DecorDetails"),
+    }
+
+    def _make_details(self, kind: str):
+        """Import and build the (view, presenter) pair for a details kind."""
+        pkg, mod, cls = self._DETAIL_KINDS[kind]
+        view = getattr(import_module(f"{pkg}.{mod}_view"), f"{cls}View")()
+        model = getattr(import_module(f"{pkg}.{mod}_model"), f"{cls}Model")()
+        presenter_cls = getattr(import_module(f"{pkg}.{mod}_presenter"), f"{cls}Presenter")
+        return view, presenter_cls(model, view)
+
+    def open_details(self, kind: str, item_id: int):
+        """Open the `kind` details page ("hall" / "service" / "decor") for the given id."""
+        self.navigate(f"{kind}:{int(item_id)}")
+
+    def _show_details(self, kind: str, item_id: int):
+        """Show the shared details page of `kind`, reloading it only when the id changed."""
+        page = self._details.get(kind)
+        if page is None:
+            view, presenter = self._make_details(kind)
+            page = self._details[kind] = (view, presenter)
+            self._stack_add(view)
+        view, presenter = page
+        # The presenter owns the bound id: it is cleared when a load fails, so
+        # reopening the same item retries instead of showing the error page
+        if presenter.bound_id != item_id:
+            presenter.start(item_id)
+        self._stack_show(view)
+
+    def _show_page(self, name: str) -> bool:
+        """Make a route current in the center stack; False for unknown routes."""
+        kind, sep, item = name.partition(":")
+        if sep and kind in self._DETAIL_KINDS:
+            self._show_details(kind, int(item))
+            return True
+        if sep and kind == "decorprice":
+            self._show_price_chart(name, int(item))
+            return True
+        if not self._ensure_page(name):
+            return False
+        self._stack_show(self._center_pages[name])
+        return True
+
+    def _built_page(self, name: str) -> Optional[QWidget]:
+        """The widget a route is shown in, if it has been built (no page is created here)."""
+        kind, sep, _item = name.partition(":")
+        if sep and kind in self._DETAIL_KINDS:
+            page = self._details.get(kind)
+            return page[0] if page is not None else None
+        if sep and kind == "decorprice":
+            hit = self._chart_lru.get(name)
+            return hit[0] if hit is not None else None
+        return self._center_pages.get(name)
+
+    # ----- Navigation helpers -----
     def navigate(self, name: str):
-        """Navigate to a center page and maintain back/forward history."""
-        if name not in self._center_pages:
+        """Navigate to a center page (building it on first visit) and maintain back/forward history."""
+        # Already showing it (e.g. a repeat click on the same nav button): nothing to update.
+        # Both checks: pages can be removed from the stack without touching history
+        target = self._built_page(name)
+        if (target is not None and self.center_stack.currentWidget() is target
+                and self._hist_index >= 0 and self._history[self._hist_index] == name):
+            return
+        if not self._show_page(name):
             return
-        self.center_stack.setCurrentWidget(self._center_pages[name])
 
-        if self._hist_index == -1 or self._history[self._hist_index] != name:
-            # Cut forward history if we branch after going back
-            if self._hist_index < len(self._history) - 1:
-                self._history = self._history[: self._hist_index + 1]
-            self._history.append(name)
-            self._hist_index += 1
+        # Cut forward history if we branch after going back
+        # (in place: no new list per navigation)
+        del self._history[self._hist_index + 1:]
+        self._history.append(name)
+        if len(self._history) > self.HISTORY_MAX:
+            del self._history[0]  # bounded: drop the oldest entry
+        self._hist_index = len(self._history) - 1
 
         self._update_nav_buttons()
-        for key, btn in self._nav_buttons:
-            btn.setChecked(key == name)
+        self._sync_nav_checked(name)
 
     def go_back(self):
         """Navigate one step back in history, if possible."""
         if self._hist_index > 0:
             self._hist_index -= 1
             name = self._history[self._hist_index]
-            self.center_stack.setCurrentWidget(self._center_pages[name])
+            self._show_page(name)
             self._update_nav_buttons()
-            for key, btn in self._nav_buttons:
-                btn.setChecked(key == name)
+            self._sync_nav_checked(name)
 
     def go_forward(self):
         """Navigate one step forward in history, if possible."""
         if self._hist_index < len(self._history) - 1:
             self._hist_index += 1
             name = self._history[self._hist_index]
-            self.center_stack.setCurrentWidget(self._center_pages[name])
+            self._show_page(name)
             self._update_nav_buttons()
-            for key, btn in self._nav_buttons:
-                btn.setChecked(key == name)
+            self._sync_nav_checked(name)
+
+    def _sync_nav_checked(self, name: str):
+        """Check the nav button for `name` (one setChecked), or clear it for non-nav pages."""
+        key = name if name in self._nav_btn_by_key else None
+        if key == self._active_nav_key:
+            return  # e.g. detail page -> detail page: nothing to change
+        if key is not None:
+            self._nav_btn_by_key[key].setChecked(True)
+        else:
+            # An exclusive group refuses to uncheck its last button
+            self._nav_group.setExclusive(False)
+            self._nav_btn_by_key[self._active_nav_key].setChecked(False)
+            self._nav_group.setExclusive(True)
+        self._active_nav_key = key
 
     def _update_nav_buttons(self):
         """Enable/disable back and forward buttons based on history position."""
@@ -478,16 +573,68 @@ class MainShell(QWidget):
         self.fwd_btn.setDisabled(self._hist_index >= len(self._history) - 1)
 
     def open_decor_price_chart(self, decor_id: int):
-        """Open (or reuse) the decor price chart page for the given decor id."""
-        page_name = f"decorprice:{int(decor_id)}"
-        if page_name in self._center_pages:
-            self.navigate(page_name)
-            return
-
-        view = DecorPriceView()
-        presenter = DecorPricePresenter(DecorPriceModel(), view)
-        presenter.show_for(int(decor_id))  # loads data and renders the chart
-        self._presenters.append(presenter)  # prevent GC
-
-        self._register_center_page(page_name, view)
-        self.navigate(page_name)
\ No newline at end of file
+        """Open the decor price chart page for the given decor id."""
+        self.navigate(f"decorprice:{int(decor_id)}")
+
+    def _show_price_chart(self, name: str, decor_id: int):
+        """Show a cached chart page (LRU) or build it; evicted routes are simply rebuilt."""
+        hit = self._chart_lru.get(name)
+        if hit is None:
+            from UI.graphs.decor_price_view import DecorPriceView
+            from UI.graphs.decor_price_model import DecorPriceModel
+            from UI.graphs.decor_price_presenter import DecorPricePresenter
+            view = DecorPriceView()
+            presenter = DecorPricePresenter(DecorPriceModel(), view)
+            presenter.show_for(decor_id)  # loads data and renders the chart
+            self._stack_add(view)
+            # The LRU entry is the owning reference for both view and presenter
+            hit = self._chart_lru[name] = (view, presenter)
+            while len(self._chart_lru) > self.CHART_PAGE_CACHE:
+                old_view, old_presenter = self._chart_lru.popitem(last=False)[1]
+                self._dispose_presenter(old_presenter)
+                self._stack_remove(old_view)
+                old_view.deleteLater()
+        else:
+            self._chart_lru.move_to_end(name)
+        self._stack_show(hit[0])
+
+    @staticmethod
+    def _dispose_presenter(presenter):
+        """
+        Retire a presenter: disconnect its view's signals (view -> presenter, and
+        any -> shell links), then drop its view/model refs so their data can be reclaimed.
+        """
+        view = getattr(presenter, "view", None)
+        if view is not None:
+            MainShell._disconnect_view(view)
+        for attr in ("view", "model"):
+            if hasattr(presenter, attr):
+                setattr(presenter, attr, None)
+
+    @staticmethod
+    def _disconnect_view(view):
+        """Disconnect every slot from the signals a page view class declares itself."""
+        for cls in type(view).__mro__:
+            if cls.__module__.startswith(("PySide6", "shiboken6")):
+                break  # Qt's own signals (destroyed, ...) are left alone
+            for name, attr in vars(cls).items():
+                if isinstance(attr, Signal):
+                    try:
+                        getattr(view, name).disconnect()
+                    except (RuntimeError, TypeError):
+                        pass  # nothing connected / view already deleted
+
+    def dispose(self):
+        """Release every presenter this shell owns (called before the shell is deleted)."""
+        self._teardown()  # the _link connections; the rest go with each view below
+        for presenter in self._presenters:
+            self._dispose_presenter(presenter)
+        for _view, presenter in self._details.values():
+            self._dispose_presenter(presenter)
+        for _view, presenter in self._chart_lru.values():
+            self._dispose_presenter(presenter)
+        self._presenters.clear()
+        self._details.clear()
+        self._chart_lru.clear()
+        self._user_presenter = None
+        self._user_view = None
@@ -1,22 +1,119 @@
-import requests
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+try:
+    import orjson  # optional: faster JSON decoding of large list payloads
+except ImportError:
+    orjson = None
 
 base_url = "http://127.0.0.1:8000"
+
+# (connect, read) seconds for every call
+TIMEOUT = (3, 10)
+# Pooled keep-alive connections to the API; sized for the UI's concurrent workers
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+
+# `requests` (and urllib3/idna/charset_normalizer behind it) is imported on the
+# first server call rather than at startup
+_requests = None
+# One keep-alive session for all calls, so repeated requests (e.g. sign-in
+# attempts) reuse the TCP connection instead of reconnecting every time
+_session = None
+
+def _http():
+    """Return the `requests` module, importing it on first use."""
+    global _requests
+    if _requests is None:
+        import requests
+        _requests = requests
+    return _requests
+
+def _get_session():
+    """Return the shared `requests.Session`, creating it on first use."""
+    global _session
+    if _session is None:
+        requests = _http()
+        from urllib3.util.retry import Retry
+        session = requests.Session()
+        # Idempotent calls are retried briefly on gateway errors; POSTs are not
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=(502, 503, 504)),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update({"User-Agent": "WindowsAppProject/1.0", "Accept": "application/json"})
+        _session = session
+    return _session
+
+def close() -> None:
+    """Close pooled connections (wired to QApplication.aboutToQuit)."""
+    global _session
+    if _session is not None:
+        _session.close()
+        _session = None
+
+def _json(resp) -> Any:
+    """Decode a JSON response body (orjson when installed, else `requests`' stdlib path)."""
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+def is_transient(exc: BaseException) -> bool:
+    """True for network errors worth retrying (connection failures, timeouts)."""
+    r = _http()
+    return isinstance(exc, (r.ConnectionError, r.Timeout))
+
 def request(
     path: str,
-    method: str = "GET"
+    method: str = "GET",
+    params: Optional[Dict[str, Any]] = None,
 ) -> Any:
     url = f"{base_url}{path}"
-    response = requests.request(method, url)
+    response = _get_session().request(method, url, params=params, timeout=TIMEOUT)
     response.raise_for_status()
-    return response.json()
+    return _json(response)
 
 def post(path: str, json: Optional[Dict[str, Any]] = None) -> Any:
     url = f"{base_url}{path}"
-    resp = requests.post(url, json=json or {})
+    resp = _get_session().post(url, json=json or {}, timeout=TIMEOUT)
     resp.raise_for_status()
     try:
-        return resp.json()
+        return _json(resp)
     except Exception:
         # Some simple endpoints may return plain int in text
-        return resp.text
\ No newline at end of file
+        return resp.text
+
+
+class FetchSignals(QObject):
+    """
+    Result bridge for Fetcher (QRunnable is not a QObject). Owned by the caller
+    (e.g. a presenter) and connected once; `tag` lets it drop stale results.
+    """
+    finished = Signal(object, object)  # tag, result
+    failed = Signal(object, str)       # tag, error message
+
+class Fetcher(QRunnable):
+    """Runs `fn()` (blocking server calls) on a pool thread and reports through `signals`."""
+
+    def __init__(self, fn: Callable[[], Any], signals: FetchSignals, tag: Any = None):
+        super().__init__()
+        self._fn = fn
+        self._signals = signals
+        self._tag = tag
+
+    def run(self):
+        try:
+            result = self._fn()
+        except Exception as e:
+            self._emit(self._signals.failed, str(e))
+            return
+        self._emit(self._signals.finished, result)
+
+    def _emit(self, signal, payload) -> None:
+        try:
+            signal.emit(self._tag, payload)
+        except RuntimeError:
+            pass  # owner (and its FetchSignals) deleted while the call ran
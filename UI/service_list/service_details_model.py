@@ -1,6 +1,51 @@
-from typing import Optional, Dict, Any
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Set, Tuple
+from PySide6.QtCore import QThreadPool
 from UI import server_access
 
 class ServiceDetailsModel:
+    # Rows fetched ahead of a click (card hover), shared by all instances and
+    # filled from pool threads, so guarded by a lock
+    PREFETCH_CACHE_SIZE = 32
+    PREFETCH_TTL_S = 60.0
+    _prefetched: "OrderedDict[int, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+    _prefetching: Set[int] = set()
+    _lock = threading.Lock()
+
     def fetch(self, service_id: int) -> Optional[Dict[str, Any]]:
-        return server_access.request(f"/DB/services/get/{service_id}")
\ No newline at end of file
+        return server_access.request(f"/DB/services/get/{service_id}")
+
+    def cached(self, service_id: int) -> Optional[Dict[str, Any]]:
+        """A prefetched row for `service_id` if one is still fresh, else None."""
+        with self._lock:
+            hit = self._prefetched.get(service_id)
+            if hit is None or time.monotonic() - hit[0] > self.PREFETCH_TTL_S:
+                return None
+            return hit[1]
+
+    @classmethod
+    def prefetch(cls, service_id: int) -> None:
+        """Fetch the row on the thread pool so a following click can skip the round-trip."""
+        with cls._lock:
+            hit = cls._prefetched.get(service_id)
+            fresh = hit is not None and time.monotonic() - hit[0] <= cls.PREFETCH_TTL_S
+            if fresh or service_id in cls._prefetching:
+                return
+            cls._prefetching.add(service_id)
+        QThreadPool.globalInstance().start(lambda: cls._prefetch_run(service_id))
+
+    @classmethod
+    def _prefetch_run(cls, service_id: int) -> None:
+        try:
+            row = cls().fetch(service_id)
+        except Exception:
+            row = None  # a failed prefetch is just a cache miss; start() fetches again
+        with cls._lock:
+            cls._prefetching.discard(service_id)
+            if isinstance(row, dict):
+                cls._prefetched[service_id] = (time.monotonic(), row)
+                cls._prefetched.move_to_end(service_id)
+                while len(cls._prefetched) > cls.PREFETCH_CACHE_SIZE:
+                    cls._prefetched.popitem(last=False)
@@ -1,4 +1,5 @@
-from PySide6.QtCore import QObject
+from PySide6.QtCore import QObject, QThreadPool, Qt
+from UI.server_access import Fetcher, FetchSignals
 from .service_details_model import ServiceDetailsModel
 from .service_details_view import ServiceDetailsView
 
@@ -7,14 +8,33 @@ class ServiceDetailsPresenter(QObject):
         super().__init__()
         self.model = model
         self.view = view
+        self.bound_id = None  # latest requested id (older results are dropped); None after a failed load
+        self._fetch = FetchSignals(self)
+        self._fetch.finished.connect(self._on_loaded, Qt.QueuedConnection)
+        self._fetch.failed.connect(self._on_failed, Qt.QueuedConnection)
 
     def start(self, service_id: int):
-        self.view.set_busy(True)
-        try:
-            row = self.model.fetch(service_id) or {}
-        except Exception as e:
-            self.view.show_error(str(e))
+        """Fetch the service on the thread pool; the view stays responsive meanwhile."""
+        self.bound_id = service_id
+        row = self.model.cached(service_id)
+        if row is not None:  # prefetched on card hover: no round-trip
+            self.view.populate(row)
             self.view.set_busy(False)
             return
-        self.view.populate(row)
-        self.view.set_busy(False)
\ No newline at end of file
+        self.view.set_busy(True)
+        QThreadPool.globalInstance().start(
+            Fetcher(lambda: self.model.fetch(service_id), self._fetch, service_id)
+        )
+
+    def _on_loaded(self, service_id, row):
+        if service_id != self.bound_id or self.view is None:
+            return
+        self.view.populate(row or {})
+        self.view.set_busy(False)
+
+    def _on_failed(self, service_id, msg: str):
+        if service_id != self.bound_id or self.view is None:
+            return
+        self.bound_id = None  # so opening it again retries
+        self.view.show_error(msg)
+        self.view.set_busy(False)
@@ -5,19 +5,21 @@ from PySide6.QtWidgets import (
     QGridLayout, QMessageBox)
 from server.database.image_loader import load_into
 
-def _title(t):  lbl=QLabel(t); lbl.setStyleSheet("font-size:22px;font-weight:700;"); return lbl
-def _sub(t):    lbl=QLabel(t); lbl.setStyleSheet("color:#666;"); return lbl
-def _pill(t):   lbl=QLabel(t); lbl.setStyleSheet("padding:4px 8px;border-radius:12px;background:rgba(0,0,0,.06);"); return lbl
+# Styling lives in the global UIstyle.qss ("Details pages"); the factories only set
+# object names so no widget carries its own stylesheet
+def _title(t):  return QLabel(t, objectName="DetailTitle")
+def _sub(t):    return QLabel(t, objectName="DetailSub")
+def _pill(t):   return QLabel(t, objectName="DetailTag")
 def _kv(k,v):
     w=QFrame(); r=QHBoxLayout(w)
-    k_lbl=QLabel(k); k_lbl.setStyleSheet("color:#666;")
+    k_lbl=QLabel(k, objectName="DetailKey")
     v_lbl=QLabel(v if (v not in (None, "")) else "—"); v_lbl.setWordWrap(True)
     r.addWidget(k_lbl,1); r.addWidget(v_lbl,3)
     return w
 
 class ServiceDetailsView(QWidget):
     def __init__(self):
-        super().__init__()
+        super().__init__(objectName="ServiceDetails")
         self.setWindowTitle("Service – Details")
         self._build()
 
@@ -61,7 +63,7 @@ class ServiceDetailsView(QWidget):
         self.travel_base   = QLabel("—")
         self.travel_per_km = QLabel("—")
         for w in (self.base_price, self.price_person, self.travel_base, self.travel_per_km):
-            w.setStyleSheet("font-weight:600;")
+            w.setObjectName("DetailValue")
         p.addWidget(QLabel("Base price"),       0,0); p.addWidget(self.base_price,    0,1)
         p.addWidget(QLabel("Price per person"), 1,0); p.addWidget(self.price_person,  1,1)
         p.addWidget(QLabel("Travel fee (base)"),2,0); p.addWidget(self.travel_base,   2,1)
@@ -72,16 +74,6 @@ class ServiceDetailsView(QWidget):
         meta = QFrame(objectName="Card"); self.meta_lay = QVBoxLayout(meta); self.meta_lay.setSpacing(6)
         lay.addWidget(meta)
 
-        # styling cards
-        self.setStyleSheet("""
-            QFrame#Card{
-                background:#fff;
-                border:1px solid rgba(0,0,0,.07);
-                border-radius:12px;
-                padding:12px;
-            }
-        """)
-
     # ---------- Presenter API ----------
     def set_busy(self, busy: bool):
         self.setDisabled(busy)
@@ -1,44 +1,114 @@
 """
 Model: Fetches Services (dbo.ServiceOption) from the server (no local fallbacks).
 """
+from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 from UI import server_access
-from server.database.image_loader import IMAGE_LOADER
-from PySide6.QtCore import Qt
+
+
+@dataclass(slots=True)
+class ServiceRow:
+    """A service as the list needs it, extracted once per load (raw row kept in `raw`)."""
+    id: Optional[int]
+    name: str
+    category: str
+    subcategory: str
+    region: str
+    available: bool
+    photo: str
+    haystack: str  # lower-cased search text
+    raw: Dict[str, Any]
+
+    @classmethod
+    def from_row(cls, r: Dict[str, Any]) -> "ServiceRow":
+        return cls(
+            id=r.get("ServiceId"),
+            name=r.get("ServiceName") or "",
+            category=r.get("Category") or "",
+            subcategory=r.get("Subcategory") or "",
+            region=r.get("Region") or "",
+            available=bool(r.get("Available")),
+            photo=r.get("PhotoUrl") or "",
+            haystack=" ".join([
+                str(r.get("ServiceName", "")),
+                str(r.get("Description", "")),
+                str(r.get("ShortDescription", "")),
+                str(r.get("Subcategory", "")),
+            ]).lower(),
+            raw=r,
+        )
+
+
+@dataclass(slots=True)
+class ServiceIndex:
+    """
+    One loaded catalog: typed rows (with search text), category and
+    availability indexes, distinct categories. Built on a worker by
+    ServiceListModel.load and installed as a whole on the GUI thread.
+    """
+    items: List[Dict[str, Any]] = field(default_factory=list)
+    rows: List[ServiceRow] = field(default_factory=list)
+    by_category: Dict[str, List[int]] = field(default_factory=dict)  # Category -> row positions
+    available: List[int] = field(default_factory=list)               # positions of available rows
+    categories: List[str] = field(default_factory=list)
+
+    @classmethod
+    def build(cls, items: List[Dict[str, Any]]) -> "ServiceIndex":
+        rows = [ServiceRow.from_row(item) for item in items]
+        by_category: Dict[str, List[int]] = {}
+        available: List[int] = []
+        for i, row in enumerate(rows):
+            if row.category:
+                by_category.setdefault(row.category, []).append(i)
+            if row.available:
+                available.append(i)
+        return cls(items, rows, by_category, available, sorted(by_category))
 
 
 class ServiceListModel:
     def __init__(self) -> None:
-        self._items: List[Dict[str, Any]] = []
+        self._index = ServiceIndex()
 
-    def load(self) -> None:
-        """Fetch data from server (raise on failure so the presenter can show a message if needed)."""
+    def load(self) -> ServiceIndex:
+        """
+        Fetch data from server and index it (raise on failure so the presenter
+        can show a message if needed). Touches no model state, so it can run on
+        a worker; hand the result to apply() on the GUI thread.
+        """
         data = server_access.request("/DB/services/list")
         if not isinstance(data, list):
             raise TypeError("Services list endpoint must return a list of objects.")
-        self._items = data
+        return ServiceIndex.build(data)
+
+    def apply(self, index: ServiceIndex) -> None:
+        """Install a catalog built by load() (GUI thread, same as query())."""
+        self._index = index
 
     def all(self) -> List[Dict[str, Any]]:
-        return list(self._items)
+        return list(self._index.items)
+
+    def categories(self) -> List[str]:
+        """Distinct service categories of the loaded catalog (sorted)."""
+        return list(self._index.categories)
 
-    def query(self, text: str = "", category: Optional[str] = None, available_only: bool = False) -> List[Dict[str, Any]]:
-        """Client-side search & filter on already-fetched items."""
+    def query(self, text: str = "", category: Optional[str] = None, available_only: bool = False) -> List[ServiceRow]:
+        """Client-side search & filter on already-fetched rows (uses the index installed by apply)."""
         t = (text or "").strip().lower()
         cat = (category or "").strip()
+        if cat == "All":
+            cat = ""
 
-        def match(item: Dict[str, Any]) -> bool:
-            if available_only and not bool(item.get("Available")):
-                return False
-            if cat and cat != "All" and item.get("Category") != cat:
-                return False
-            if not t:
-                return True
-            hay = " ".join([
-                str(item.get("ServiceName", "")),
-                str(item.get("Description", "")),
-                str(item.get("ShortDescription", "")),
-                str(item.get("Subcategory", "")),
-            ]).lower()
-            return t in hay
-
-        return [x for x in self._items if match(x)]
\ No newline at end of file
+        index = self._index
+        rows = index.rows
+        # Start from the narrowest index bucket; only the remaining facet is tested per row
+        if cat:
+            idx = index.by_category.get(cat, [])
+            if available_only:
+                idx = [i for i in idx if rows[i].available]
+        elif available_only:
+            idx = index.available
+        else:
+            idx = range(len(rows))
+        if not t:
+            return [rows[i] for i in idx]
+        return [rows[i] for i in idx if t in rows[i].haystack]
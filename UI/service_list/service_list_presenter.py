@@ -3,14 +3,19 @@ Presenter: ties View <-> Model (MVP)
 - Wires search, category, availability, refresh
 """
 from typing import Dict, Any
-from PySide6.QtCore import QObject
-from service_list_model import ServiceListModel
+from PySide6.QtCore import QObject, QThreadPool, Qt
+from UI.server_access import Fetcher, FetchSignals
+from .service_list_model import ServiceListModel, ServiceRow
 
 class ServiceListPresenter(QObject):
     def __init__(self, model: ServiceListModel, view) -> None:
         super().__init__()
         self.model = model
         self.view = view
+        self._load_seq = 0  # bumped per load; only the latest result is applied
+        self._fetch = FetchSignals(self)
+        self._fetch.finished.connect(self._on_loaded, Qt.QueuedConnection)
+        self._fetch.failed.connect(self._on_load_failed, Qt.QueuedConnection)
         self._connect()
 
     def _connect(self) -> None:
@@ -21,20 +26,26 @@ class ServiceListPresenter(QObject):
 
     # --- lifecycle ---
     def start(self) -> None:
+        """Load services on the thread pool; the grid is filled when the result arrives."""
         self.view.set_busy(True)
-        try:
-            self.model.load()
-        except Exception as e:
-            self.view.show_error(str(e))
-            self.view.set_busy(False)
-            return
+        self._load_seq += 1
+        QThreadPool.globalInstance().start(Fetcher(self.model.load, self._fetch, self._load_seq))
 
+    def _on_loaded(self, seq, index) -> None:
+        if seq != self._load_seq or self.view is None:
+            return
+        self.model.apply(index)  # swapped in here, on the GUI thread that queries it
         # categories (distinct from data)
-        cats = sorted({r.get("Category") for r in self.model.all() if r.get("Category")})
-        self.view.populate_categories(["All"] + cats)
+        self.view.populate_categories(["All"] + self.model.categories())
         self._apply_filters()
         self.view.set_busy(False)
 
+    def _on_load_failed(self, seq, msg: str) -> None:
+        if seq != self._load_seq or self.view is None:
+            return
+        self.view.show_error(msg)
+        self.view.set_busy(False)
+
     # --- actions ---
     def on_refresh(self) -> None:
         self.start()
@@ -51,16 +62,16 @@ class ServiceListPresenter(QObject):
         cards = [self._to_card(r) for r in rows]
         self.view.show_cards(cards)
 
-    def _to_card(self, r: Dict[str, Any]) -> Dict[str, Any]:
-        subtitle = f'{r.get("Category","")}'
-        if r.get("Subcategory"):
-            subtitle += f' · {r.get("Subcategory")}'
+    def _to_card(self, r: ServiceRow) -> Dict[str, Any]:
+        subtitle = r.category
+        if r.subcategory:
+            subtitle += f' · {r.subcategory}'
 
         return {
-            "id": r.get("ServiceId"),
-            "title": r.get("ServiceName") or "",
+            "id": r.id,
+            "title": r.name,
             "subtitle": subtitle,
-            "region": r.get("Region") or "",
-            "available": bool(r.get("Available")),
-            "photo": r.get("PhotoUrl") or "",
-        }
\ No newline at end of file
+            "region": r.region,
+            "available": r.available,
+            "photo": r.photo,
+        }
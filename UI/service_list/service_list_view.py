@@ -1,111 +1,193 @@
 """
 View: Modern card grid + search/category/availability filters
+- Cards are rows of a list model painted by a delegate inside one QListView, so
+  only the visible cards cost anything (no widget per service)
 """
-from typing import Optional, List, Dict
-from PySide6.QtCore import (Qt, QSize, Signal,
-                            QPropertyAnimation, QEasingCurve, QRect, QTimer)
+from typing import Any, Dict, List, Optional, Set
+from PySide6.QtCore import Qt, QSize, QRect, QRectF, Signal, QTimer, QAbstractListModel, QModelIndex
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPainterPath, QPen, QPixmap
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QComboBox, QCheckBox,
-    QPushButton, QScrollArea, QFrame, QGridLayout, QSizePolicy, QSpacerItem,
-    QMessageBox, QGraphicsDropShadowEffect)
-from server.database.image_loader import load_into
-
-def _apply_shadow(widget, radius=18, x_offset=0, y_offset=6):
-    """Apply a soft drop-shadow to visually elevate the card from the background."""
-    eff = QGraphicsDropShadowEffect(widget)
-    eff.setBlurRadius(radius)
-    eff.setOffset(x_offset, y_offset)
-    widget.setGraphicsEffect(eff)
-
-class ServiceCard(QFrame):
-    """A single service card"""
-    clicked = Signal(int)
-
-    def __init__(self, vm: Dict):
-        """
-        vm (view-model dict) is expected to include:
-          id, photo, title, subtitle, region, available
-        """
-        super().__init__(objectName="Card")
-        self.vm = vm
-        self.setCursor(Qt.PointingHandCursor)
-        self.setMouseTracking(True)
-        self.setMinimumSize(300, 270)
-        self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-        _apply_shadow(self, radius=18, y_offset=6)
-
-        # Hover animation (gentle grow/shrink by a few pixels)
-        self._base_geom: Optional[QRect] = None
-        self._anim = QPropertyAnimation(self, b"geometry", self)
-        self._anim.setDuration(140)
-        self._anim.setEasingCurve(QEasingCurve.OutCubic)
-        self._grow_px = 8
+    QPushButton, QListView, QStyle, QStyledItemDelegate, QStyleOptionViewItem, QFrame,
+    QMessageBox)
+from server.database.image_loader import IMAGE_LOADER, normalize_url
+from UI.ui_helpers import read_qss, LIST_QSS
 
-        self._build()
+DEFAULT_PHOTO = "https://cdn.jsdelivr.net/gh/MaiEden/pic-DB-events-app@main/dfault.png"
 
-    def _build(self):
-        """Assemble the card layout and start the async image load."""
-        lay = QVBoxLayout(self)
-        lay.setContentsMargins(12, 10, 12, 12)
-        lay.setSpacing(8)
-
-        # Image area
-        img = QLabel(objectName="CardImage")
-        img.setFixedHeight(160)
-        img.setAlignment(Qt.AlignCenter)
-        self._img = img
-
-        # Use provided image or a CDN placeholder
-        url = self.vm.get("photo") or "https://cdn.jsdelivr.net/gh/MaiEden/pic-DB-events-app@main/dfault.png"
-        load_into(img, url, size=QSize(420, 160))
-
-        # Text fields
-        title = QLabel(self.vm.get("title", ""), objectName="CardTitle")
-        subtitle = QLabel(self.vm.get("subtitle", ""), objectName="CardSubtitle")
-
-        # Meta row: region + availability pill (styled via QSS using 'ok' property)
-        meta = QHBoxLayout()
-        region = QLabel(self.vm.get("region") or "", objectName="Region")
-        pill = QLabel("Available" if self.vm.get("available") else "Unavailable", objectName="Pill")
-        pill.setProperty("ok", bool(self.vm.get("available")))
-        meta.addWidget(region)
-        meta.addWidget(pill)
-
-        # Compose
-        lay.addWidget(img)
-        lay.addSpacing(6)
-        lay.addWidget(title)
-        lay.addWidget(subtitle)
-        lay.addLayout(meta)
-
-    # --- Hover grow/shrink ---
-    def enterEvent(self, e):
-        """Animate a slight grow on hover based on the initial geometry."""
-        if self._base_geom is None:
-            self._base_geom = self.geometry()
-        g = self._base_geom
-        grow = self._grow_px
-        target = QRect(g.x() - grow // 2, g.y() - grow // 2, g.width() + grow, g.height() + grow)
-        self._anim.stop()
-        self._anim.setStartValue(self.geometry())
-        self._anim.setEndValue(target)
-        self._anim.start()
-        super().enterEvent(e)
-
-    def leaveEvent(self, e):
-        """Return to the base geometry when the cursor leaves the card."""
-        if self._base_geom is not None:
-            self._anim.stop()
-            self._anim.setStartValue(self.geometry())
-            self._anim.setEndValue(self._base_geom)
-            self._anim.start()
-        super().leaveEvent(e)
-
-    def mouseReleaseEvent(self, e):
-        """Emit the card id on left-button release (click)."""
-        if e.button() == Qt.LeftButton:
-            self.clicked.emit(int(self.vm.get("id") or -1))
-        super().mouseReleaseEvent(e)
+# Custom item roles of ServiceCardModel
+VM_ROLE = Qt.UserRole + 1      # the card view-model dict
+PHOTO_ROLE = Qt.UserRole + 2   # normalized photo URL
+
+
+class ServiceCardModel(QAbstractListModel):
+    """
+    Card view-models as a Qt list model (one row per service). Filtering stays
+    with the presenter/ServiceListModel index; each result list is swapped in
+    with set_cards().
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cards: List[Dict] = []
+        self._photos: List[str] = []  # normalized photo URL per row
+        self._rows_by_photo: Dict[str, List[int]] = {}
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._cards)
+
+    def data(self, index, role=Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == VM_ROLE:
+            return self._cards[row]
+        if role == PHOTO_ROLE:
+            return self._photos[row]
+        if role == Qt.DisplayRole:
+            return self._cards[row].get("title", "")
+        return None
+
+    def cards(self) -> List[Dict]:
+        return self._cards
+
+    def set_cards(self, cards: List[Dict]):
+        """Replace all rows (one model reset: the view lays out in batches, no widgets built)."""
+        self.beginResetModel()
+        self._cards = list(cards)
+        self._photos = [normalize_url(vm.get("photo") or DEFAULT_PHOTO) for vm in self._cards]
+        self._rows_by_photo = {}
+        for row, url in enumerate(self._photos):
+            self._rows_by_photo.setdefault(url, []).append(row)
+        self.endResetModel()
+
+    def photo_ready(self, url: str):
+        """Repaint the rows showing `url` (its pixmap just arrived)."""
+        for row in self._rows_by_photo.get(url, ()):
+            idx = self.index(row)
+            self.dataChanged.emit(idx, idx, [PHOTO_ROLE])
+
+
+class ServiceCardDelegate(QStyledItemDelegate):
+    """
+    Paints a service card (photo, title, subtitle, region, availability pill) with
+    QPainter, in the look of list_style.qss's flat Card. Photos are requested from
+    IMAGE_LOADER the first time a card is painted, i.e. only for visible cards.
+    """
+    CARD_SIZE = QSize(300, 270)
+    IMG_SIZE = QSize(420, 160)  # same scaled variant the hall cards use
+    RADIUS = 16
+
+    # Colors from list_style.qss
+    _BG = QColor("#ffffff")
+    _BORDER = QColor(0, 0, 0, 26)
+    _BORDER_HOVER = QColor(0, 0, 0, 46)
+    _IMG_BG = QColor("#f5f7fa")
+    _TITLE = QColor("#1f2937")
+    _SUBTITLE = QColor("#6b7280")
+    _REGION = QColor("#374151")
+    # ok -> (text, background, border)
+    _PILL = {
+        True: (QColor("#166534"), QColor("#e8f5ec"), QColor("#bbdfc7")),
+        False: (QColor("#92400e"), QColor("#fff7ed"), QColor("#fde0c2")),
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._requested: Set[str] = set()  # photo URLs asked from the loader, not yet ready
+        self._fonts: Dict[str, QFont] = {}
+
+    def sizeHint(self, option, index) -> QSize:
+        return self.CARD_SIZE
+
+    def photo_ready(self, url: str):
+        """The loader delivered `url`; it can be requested again if later evicted."""
+        self._requested.discard(url)
+
+    def _font(self, base: QFont, px: int, bold: bool) -> QFont:
+        key = f"{px}{'b' if bold else ''}"
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = QFont(base)
+            font.setPixelSize(px)
+            font.setWeight(QFont.DemiBold if bold else QFont.Normal)
+        return font
+
+    def _photo(self, url: str) -> Optional[QPixmap]:
+        """The scaled photo if decoded, otherwise None (and a fetch is started once)."""
+        pm = IMAGE_LOADER.cached(url)
+        if pm is not None:
+            return IMAGE_LOADER.scaled(url, pm, self.IMG_SIZE)
+        if url not in self._requested:
+            self._requested.add(url)
+            IMAGE_LOADER.fetch(url, origin=url, size=self.IMG_SIZE)
+        return None
+
+    def paint(self, p: QPainter, option: QStyleOptionViewItem, index):
+        vm = index.data(VM_ROLE)
+        if vm is None:
+            return
+        r = option.rect
+        hovered = bool(option.state & QStyle.State_MouseOver)
+        p.save()
+        p.setRenderHint(QPainter.Antialiasing)
+
+        # Card body
+        body = QPainterPath()
+        body.addRoundedRect(QRectF(r).adjusted(0.5, 0.5, -0.5, -0.5), self.RADIUS, self.RADIUS)
+        p.fillPath(body, self._BG)
+        p.setPen(QPen(self._BORDER_HOVER if hovered else self._BORDER, 1))
+        p.drawPath(body)
+
+        # Photo (center-cropped into the image area), placeholder background meanwhile
+        img_rect = QRect(r.left() + 12, r.top() + 10, r.width() - 24, 160)
+        clip = QPainterPath()
+        clip.addRoundedRect(QRectF(img_rect), self.RADIUS, self.RADIUS)
+        p.fillPath(clip, self._IMG_BG)
+        pm = self._photo(index.data(PHOTO_ROLE))
+        if pm is not None and not pm.isNull():
+            src = QRect(0, 0, img_rect.width(), img_rect.height())
+            src.moveCenter(pm.rect().center())
+            p.setClipPath(clip)
+            p.drawPixmap(img_rect, pm, src)
+            p.setClipping(False)
+
+        # Title + subtitle (elided to the card width)
+        text_x, text_w = r.left() + 24, r.width() - 48
+        y = img_rect.bottom() + 15
+        for text, px, bold, color in (
+            (vm.get("title", ""), 15, True, self._TITLE),
+            (vm.get("subtitle", ""), 13, False, self._SUBTITLE),
+        ):
+            font = self._font(option.font, px, bold)
+            fm = QFontMetrics(font)
+            p.setFont(font)
+            p.setPen(color)
+            p.drawText(QRect(text_x, y, text_w, fm.height()), Qt.AlignLeft | Qt.AlignVCenter,
+                       fm.elidedText(text, Qt.ElideRight, text_w))
+            y += fm.height() + 8
+
+        # Meta row: region on the left, availability pill on the right
+        available = bool(vm.get("available"))
+        pill_font = self._font(option.font, 12, True)
+        pill_text = "Available" if available else "Unavailable"
+        pill_w = QFontMetrics(pill_font).horizontalAdvance(pill_text) + 24
+        pill = QRect(r.right() - 12 - pill_w, r.bottom() - 12 - 26, pill_w, 26)
+        fg, bg, border = self._PILL[available]
+        p.setPen(QPen(border, 2))
+        p.setBrush(bg)
+        p.drawRoundedRect(QRectF(pill).adjusted(1, 1, -1, -1), 12, 12)
+        p.setFont(pill_font)
+        p.setPen(fg)
+        p.drawText(pill, Qt.AlignCenter, pill_text)
+
+        region_font = self._font(option.font, 12, False)
+        region_w = pill.left() - 8 - text_x
+        p.setFont(region_font)
+        p.setPen(self._REGION)
+        p.drawText(QRect(text_x, pill.top(), region_w, pill.height()), Qt.AlignLeft | Qt.AlignVCenter,
+                   QFontMetrics(region_font).elidedText(vm.get("region") or "", Qt.ElideRight, region_w))
+        p.restore()
 
 
 class ServiceListView(QWidget):
@@ -118,21 +200,26 @@ class ServiceListView(QWidget):
     availableChanged = Signal(bool)
     refreshRequested = Signal()
     cardClicked = Signal(int)
+    cardHovered = Signal(int)  # pointer rested on a card (used to prefetch details)
 
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Services Catalog")
         self.resize(1120, 720)
-        self._cards_cache: List[Dict] = []
+        self._model = ServiceCardModel(self)
+        self._delegate = ServiceCardDelegate(self)
+        # Hover intent: only a card the pointer stays on is reported, not every card swept over
+        self._hovered_id = -1
+        self._hover_intent = QTimer(self)
+        self._hover_intent.setSingleShot(True)
+        self._hover_intent.setInterval(120)
+        self._hover_intent.timeout.connect(lambda: self.cardHovered.emit(self._hovered_id))
         self._build()
         self._load_qss()
-
-    def showEvent(self, e):
-        super().showEvent(e)
-        QTimer.singleShot(0, self._rebuild_grid)
+        IMAGE_LOADER.pixmapReady.connect(self._on_pixmap_ready)
 
     def _build(self):
-        """Construct toolbar (search/filters), scroll area, grid, and empty-state label."""
+        """Construct toolbar (search/filters), the card list, and empty-state label."""
         root = QVBoxLayout(self)
         root.setContentsMargins(12, 12, 12, 12)
         root.setSpacing(10)
@@ -140,7 +227,12 @@ class ServiceListView(QWidget):
         # --- Toolbar ----------------------------------------------------------
         bar = QHBoxLayout()
         self.search = QLineEdit(placeholderText="Search services by name, description or subcategory…")
-        self.search.textChanged.connect(lambda s: self.searchChanged.emit(s))
+        # Coalesce keystrokes: only the text after a short pause reaches the presenter
+        self._search_debounce = QTimer(self)
+        self._search_debounce.setSingleShot(True)
+        self._search_debounce.setInterval(180)
+        self._search_debounce.timeout.connect(lambda: self.searchChanged.emit(self.search.text()))
+        self.search.textChanged.connect(lambda _s: self._search_debounce.start())
 
         self.category = QComboBox()
         self.category.currentTextChanged.connect(lambda s: self.categoryChanged.emit(s))
@@ -158,17 +250,26 @@ class ServiceListView(QWidget):
         bar.addWidget(self.refresh_btn, 0)
         root.addLayout(bar)
 
-        # --- Scrollable responsive grid --------------------------------------
-        self.scroll = QScrollArea()
-        self.scroll.setWidgetResizable(True)
-        self.scroll.setAlignment(Qt.AlignLeft | Qt.AlignTop)
-        wrap = QWidget()
-        self.grid = QGridLayout(wrap)
-        self.grid.setContentsMargins(4, 4, 4, 4)
-        self.grid.setHorizontalSpacing(16)
-        self.grid.setVerticalSpacing(16)
-        self.scroll.setWidget(wrap)
-        root.addWidget(self.scroll)
+        # --- Card grid: one QListView, cards painted by the delegate ----------
+        self.list = QListView(objectName="CardList")
+        self.list.setModel(self._model)
+        self.list.setItemDelegate(self._delegate)
+        self.list.setViewMode(QListView.IconMode)
+        self.list.setResizeMode(QListView.Adjust)       # re-flow columns on resize
+        self.list.setMovement(QListView.Static)
+        self.list.setUniformItemSizes(True)             # one sizeHint for every row
+        self.list.setLayoutMode(QListView.Batched)      # big result sets laid out in chunks
+        self.list.setSpacing(8)
+        self.list.setSelectionMode(QListView.NoSelection)
+        self.list.setEditTriggers(QListView.NoEditTriggers)
+        self.list.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.list.setFrameShape(QFrame.NoFrame)
+        self.list.setMouseTracking(True)                # hover state + entered()
+        self.list.viewport().setAttribute(Qt.WA_Hover)
+        self.list.viewport().setCursor(Qt.PointingHandCursor)
+        self.list.clicked.connect(self._on_clicked)
+        self.list.entered.connect(self._on_entered)
+        root.addWidget(self.list)
 
         # Empty-state label (shown when there are no cards)
         self.empty = QLabel("No results", alignment=Qt.AlignCenter)
@@ -176,11 +277,10 @@ class ServiceListView(QWidget):
         root.addWidget(self.empty)
 
     def _load_qss(self):
-        """Load and apply external QSS (keeps most styling out of the code)."""
-        from pathlib import Path
-        qss_path = Path(__file__).resolve().parent.parent / "style&icons" / "list_style.qss"
-        if qss_path.exists():
-            self.setStyleSheet(qss_path.read_text(encoding="utf-8"))
+        """Apply the shared list QSS (read from disk only once per process)."""
+        qss = read_qss(LIST_QSS)
+        if qss:
+            self.setStyleSheet(qss)
 
     # --- Presenter API --------------------------------------------------------
     def set_busy(self, busy: bool):
@@ -211,52 +311,27 @@ class ServiceListView(QWidget):
         return self.available.isChecked()
 
     def show_cards(self, cards: List[Dict]):
-        """Receive cards from the presenter and rebuild the grid."""
-        self._cards_cache = cards
-        self._rebuild_grid()
-
-    def resizeEvent(self, e):
-        """Recompute layout on resize to keep the grid responsive."""
-        super().resizeEvent(e)
-        if self._cards_cache:
-            self._rebuild_grid()
-
-    def _rebuild_grid(self):
-        """
-        Populate the grid with ServiceCard widgets.
-
-        The number of columns is derived from the viewport width to achieve a
-        responsive layout. We also clear previous widgets safely to avoid leaks.
-        """
-        # Clear existing items/widgets
-        while self.grid.count():
-            it = self.grid.takeAt(0)
-            w = it.widget()
-            if w:
-                w.setParent(None)
-
-        # Handle empty state
-        if not self._cards_cache:
-            self.empty.setVisible(True)
-            return
-        self.empty.setVisible(False)
-
-        # Determine column count from viewport width
-        viewport_w = self.scroll.viewport().contentsRect().width()
-        card_w = 340  # nominal card width for column calculation
-        cols = max(1, viewport_w // card_w)
-
-        # Add cards row-by-row
-        r = c = 0
-        for vm in self._cards_cache:
-            card = ServiceCard(vm)
-            card.clicked.connect(lambda _id, v=vm: self.cardClicked.emit(int(v.get("id") or -1)))
-            self.grid.addWidget(card, r, c)
-            c += 1
-            if c >= cols:
-                r += 1
-                c = 0
-
-        # Add a vertical spacer to keep cards pinned to the top
-        self.grid.addItem(QSpacerItem(0, 0, QSizePolicy.Minimum, QSizePolicy.Expanding), r + 1, 0, 1, cols)
-        self.grid.setRowStretch(r + 1, 1)
\ No newline at end of file
+        """Receive cards from the presenter (skipped when nothing changed)."""
+        if cards == self._model.cards():
+            return  # e.g. another keystroke that matches the same services
+        self._model.set_cards(cards)
+        self.empty.setVisible(not cards)
+
+    # --- Item view events -----------------------------------------------------
+    def _card_id(self, index) -> int:
+        vm = index.data(VM_ROLE) or {}
+        return int(vm.get("id") or -1)
+
+    def _on_clicked(self, index):
+        """Emit the card id on left-click."""
+        self.cardClicked.emit(self._card_id(index))
+
+    def _on_entered(self, index):
+        """Restart the hover-intent timer for the card under the pointer."""
+        self._hovered_id = self._card_id(index)
+        self._hover_intent.start()
+
+    def _on_pixmap_ready(self, origin: str, _pm):
+        """A photo finished loading: repaint the cards that show it."""
+        self._delegate.photo_ready(origin)
+        self._model.photo_ready(origin)
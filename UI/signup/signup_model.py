@@ -19,16 +19,16 @@ class SignUpModel:
         if not (p and u and ph and r):
             return False, "All fields are required."
 
-        # Uniqueness
-        user = server_access.request(f"/DB/users/get_user_by_name/{username}")
-        if user:
-            return False, "Username already exists."
-
-        # Rule: password length
+        # Rule: password length (checked locally, before any server call)
         if len(ph) < 6:
             return False, "Password must be at least 6 characters."
 
-        # Insert the new user into the database
-        server_access.request(f"/DB/users/insert_user/{phone}/{username}/{password_hash}/{region}")
-        print(server_access.request(f"/DB/users/get_user_by_name/{username}"))  # Debug: print the newly created user
-        return True, "Account created successfully, loading app data..."
\ No newline at end of file
+        # Uniqueness check + insert in a single round-trip
+        res = server_access.post(
+            "/DB/users/register",
+            json={"Phone": p, "Username": u, "PasswordHash": ph, "Region": r},
+        )
+        if not isinstance(res, dict) or not res.get("ok"):
+            reason = res.get("reason") if isinstance(res, dict) else ""
+            return False, reason or "Could not create the account."
+        return True, "Account created successfully, loading app data..."
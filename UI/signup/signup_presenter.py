@@ -1,32 +1,41 @@
 """
 Presenter for Sign Up screen
 """
-from typing import Optional
-from PySide6.QtCore import QObject, Signal, Slot, QThread
+from PySide6.QtCore import QObject, Signal, Slot, QRunnable, QThreadPool, Qt
 from UI.signup.signup_model import SignUpModel
 from UI.signup.signup_view import SignUpView
 from UI.ui_helpers import start_button_loading, stop_button_loading
 
-class _SignUpWorker(QObject):
-    """Worker that runs inside a QThread and performs the registration call."""
+class _SignUpSignals(QObject):
+    """Signal bridge for _SignUpRunnable (QRunnable is not a QObject)."""
     finished = Signal(bool, str)  # ok, message
 
-    def __init__(self, model: SignUpModel, phone: str, username: str, pwd_hash: str, region: str):
+class _SignUpRunnable(QRunnable):
+    """
+    Reusable pool task that performs the registration call off the GUI thread.
+    Not auto-deleted: the presenter owns one instance and re-arms it per submit.
+    """
+
+    def __init__(self, model: SignUpModel, signals: _SignUpSignals):
         super().__init__()
+        self.setAutoDelete(False)
         self._model = model
+        self._signals = signals
+        self.set_form("", "", "", "")
+
+    def set_form(self, phone: str, username: str, pwd_hash: str, region: str):
         self._phone = phone
         self._username = username
         self._pwd_hash = pwd_hash
         self._region = region
 
-    @Slot()
     def run(self):
-        """Execute the blocking sign-up logic off the GUI thread and emit the result."""
+        """Execute the blocking sign-up logic on a pool thread and emit the result."""
         try:
             ok, msg = self._model.register(self._phone, self._username, self._pwd_hash, self._region)
         except Exception as e:
             ok, msg = False, f"Sign up failed: {e}"
-        self.finished.emit(ok, msg)
+        self._signals.finished.emit(ok, msg)
 
 
 class SignUpPresenter(QObject):
@@ -37,8 +46,13 @@ class SignUpPresenter(QObject):
         super().__init__()
         self.model = model
         self.view = view
-        self._thread: Optional[QThread] = None
-        self._worker: Optional[_SignUpWorker] = None
+        self._pending_username: str = ""
+        self._in_flight = False
+        # One signal bridge for all sign-up tasks; results are queued to the GUI thread
+        self._signals = _SignUpSignals(self)
+        self._signals.finished.connect(self._on_finished, Qt.QueuedConnection)
+        # One task reused for every submit (guarded by _in_flight)
+        self._runnable = _SignUpRunnable(self.model, self._signals)
         self._connect_signals()
 
     def _connect_signals(self):
@@ -47,42 +61,31 @@ class SignUpPresenter(QObject):
 
     @Slot()
     def on_submit(self):
-        """Collect form data, show loading, start worker in a background thread."""
+        """Collect form data, show loading, run the registration on the global thread pool."""
+        if self._in_flight:
+            return
+        self._in_flight = True
+
         phone = self.view.get_phone()
         username = self.view.get_username()
         pwd_hash = self.view.get_password_hash()
         region = self.view.get_region()
+        self._pending_username = username
 
         # Put the submit button in a loading state (spinner inside the button + disable)
         start_button_loading(self.view.submit_btn, "creating an account...")
 
-        # Create thread and worker
-        self._thread = QThread(self)
-        self._worker = _SignUpWorker(self.model, phone, username, pwd_hash, region)
-        self._worker.moveToThread(self._thread)
-
-        # When the thread starts → run the worker job
-        self._thread.started.connect(self._worker.run)
-
-        # When finished → handle result and clean up resources
-        def _on_finished(ok: bool, msg: str):
-            stop_button_loading(self.view.submit_btn)
-            print("Sign up OK" if ok else "Sign up failed")
-            self.view.show_message(msg, status="ok" if ok else "error")
-            if ok:
-                self.auth_ok.emit(username)
-
-            # Tidy cleanup
-            if self._thread is not None:
-                self._thread.quit()
-                self._thread.wait()
-                self._thread.deleteLater()
-            if self._worker is not None:
-                self._worker.deleteLater()
-            self._thread = None
-            self._worker = None
-
-        self._worker.finished.connect(_on_finished)
+        # Re-arm the presenter-owned task; submitting is just an enqueue
+        self._runnable.set_form(phone, username, pwd_hash, region)
+        QThreadPool.globalInstance().start(self._runnable)
 
-        # Start the thread
-        self._thread.start()
\ No newline at end of file
+    @Slot(bool, str)
+    def _on_finished(self, ok: bool, msg: str):
+        """Runs on the GUI thread (connected via QueuedConnection)."""
+        self._in_flight = False
+        self._runnable.set_form("", "", "", "")  # don't keep the password hash around
+        stop_button_loading(self.view.submit_btn)
+        self.view.show_message(msg, status="ok" if ok else "error")
+        if ok:
+            self.auth_ok.emit(self._pending_username)
+        self._pending_username = ""
@@ -1,19 +1,22 @@
 from pathlib import Path
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QIcon, QPixmap
+from PySide6.QtCore import Qt, Signal, Slot
+from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
-    QFrame, QComboBox, QGraphicsDropShadowEffect
+    QFrame, QComboBox
 )
+from UI.ui_helpers import ShadowFrame, scaled_pixmap, scaled_pixmap_async
 
 BASE_DIR = Path(__file__).resolve().parents[1]
+_LOGO_PATH = BASE_DIR / "style&icons" / "EventPlannerLogo.png"
+_LOGO_SIZE = 120
 
-def apply_drop_shadow(widget, radius=18, x_offset=0, y_offset=6):
-    """Apply a subtle, modern drop shadow to a widget."""
-    shadow = QGraphicsDropShadowEffect(widget)
-    shadow.setBlurRadius(radius)
-    shadow.setOffset(x_offset, y_offset)
-    widget.setGraphicsEffect(shadow)
+def prefetch_logo() -> None:
+    """
+    Decode + scale the header logo on the thread pool ahead of the first SignUpView
+    (which is only built when the user clicks "Sign up"); the view then hits QPixmapCache.
+    """
+    scaled_pixmap_async(_LOGO_PATH, _LOGO_SIZE, lambda _pix: None)
 
 class SignUpView(QWidget):
     # View -> Presenter signals
@@ -39,7 +42,6 @@ class SignUpView(QWidget):
         # Card container
         self.card = QFrame(objectName="Card")
         self.card.setFixedWidth(460)  # default card width
-        apply_drop_shadow(self.card)
 
         layout = QVBoxLayout(self.card)
         layout.setContentsMargins(26, 26, 26, 26)
@@ -62,15 +64,12 @@ class SignUpView(QWidget):
 
         # Right: icon
         self.icon_label = QLabel()
-        icon_size = 120
+        icon_size = _LOGO_SIZE
 
-        # Load icon from file
-        icon_path = BASE_DIR / "style&icons" / "EventPlannerLogo.png"
-        pix = QPixmap(icon_path)
+        # Load icon from file (decoded and scaled once, shared via QPixmapCache)
+        pix = scaled_pixmap(_LOGO_PATH, icon_size)
         if not pix.isNull():
-            self.icon_label.setPixmap(
-                pix.scaled(icon_size, icon_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            )
+            self.icon_label.setPixmap(pix)
         self.icon_label.setFixedSize(icon_size, icon_size)
         self.icon_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
 
@@ -113,13 +112,14 @@ class SignUpView(QWidget):
         # Center the card in the window
         wrap = QVBoxLayout()
         wrap.addStretch(1)
-        wrap.addWidget(self.card, alignment=Qt.AlignHCenter)
+        wrap.addWidget(ShadowFrame(self.card), alignment=Qt.AlignHCenter)
         wrap.addStretch(1)
         root.addLayout(wrap)
 
     def _wire_events(self):
-        self.submit_btn.clicked.connect(self.submit_clicked.emit)
-        self.cancel_btn.clicked.connect(self.cancel_clicked.emit)
+        # Signal-to-signal: forwarded inside Qt, no Python call per click
+        self.submit_btn.clicked.connect(self.submit_clicked)
+        self.cancel_btn.clicked.connect(self.cancel_clicked)
 
     def _center_on_screen(self):
         frame = self.frameGeometry()
@@ -142,9 +142,13 @@ class SignUpView(QWidget):
     def get_region(self) -> str:
         return self.region.currentText()
 
+    @Slot(str, str)
     def show_message(self, text: str, status: str):
         """Show inline success/error message styled via QSS."""
         self.message.setText(text)
-        self.message.setProperty("status", status)  # 'ok' / 'error'
-        # Short style refresh so [status="..."] selectors apply immediately
-        self.message.setStyle(self.message.style())
\ No newline at end of file
+        if status != self.message.property("status"):
+            self.message.setProperty("status", status)  # 'ok' / 'error'
+            # Re-polish only this label so [status="..."] selectors apply immediately
+            st = self.message.style()
+            st.unpolish(self.message)
+            st.polish(self.message)
\ No newline at end of file
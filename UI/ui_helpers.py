@@ -1,8 +1,13 @@
 # ui_helpers.py
+from difflib import SequenceMatcher
+from functools import lru_cache
 from pathlib import Path
-from PySide6.QtCore import QSize
-from PySide6.QtGui import QMovie, QIcon
-from PySide6.QtWidgets import QPushButton
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from PySide6.QtCore import (Qt, QSize, QRect, QObject, QRunnable, QThreadPool, Signal,
+                            QPropertyAnimation, QEasingCurve)
+from PySide6.QtGui import QMovie, QIcon, QPixmap, QPainter, QPixmapCache, QImage
+from PySide6.QtWidgets import QPushButton, QWidget, QVBoxLayout, QGridLayout, QSizePolicy, QSpacerItem
+from shiboken6 import isValid
 
 _SPINNER_GIF_PATHS = [
     # ממליץ לשים קובץ קטן, שקוף, 24x24 בפאת' הזה
@@ -10,11 +15,336 @@ _SPINNER_GIF_PATHS = [
     Path(__file__).resolve().parents[0] / "style&icons" / "spinner2.gif",
 ]
 
+LIST_QSS = Path(__file__).resolve().parents[0] / "style&icons" / "list_style.qss"
+
+CARD_SHADOW_PNG = Path(__file__).resolve().parents[0] / "style&icons" / "card_shadow.png"
+# Card inset inside card_shadow.png (left, top, right, bottom) and the 9-slice borders
+# (inset + 16px corner radius) that keep the rounded corners unstretched
+_SHADOW_INSET = (12, 6, 12, 18)
+_SHADOW_SLICE = (28, 22, 28, 34)
+
+@lru_cache(maxsize=None)
+def read_qss(path: Path) -> str:
+    """Return the text of a QSS file, read from disk once per process ("" if missing)."""
+    return path.read_text(encoding="utf-8") if path.exists() else ""
+
+# The single QPixmapCache budget (KB) for every pixmap in the app: local images here
+# and ImageLoader's scaled photos; AppWindow applies it at startup
+PIXMAP_CACHE_KB = 64 * 1024
+
+def cached_pixmap(path: Path) -> QPixmap:
+    """Local image at its native size, decoded once and shared via QPixmapCache."""
+    key = f"file:{path}"
+    pix = QPixmap()
+    if QPixmapCache.find(key, pix):
+        return pix
+    pix = QPixmap.fromImage(QImage(str(path)))
+    if not pix.isNull():
+        QPixmapCache.insert(key, pix)
+    return pix
+
+def _pixmap_key(path: Path, size: int, height_only: bool) -> str:
+    return f"file:{path}@{size}{'h' if height_only else ''}"
+
+def _decode_scaled(path: Path, size: int, height_only: bool) -> QImage:
+    """Decode + smooth-scale as a QImage (safe off the GUI thread)."""
+    img = QImage(str(path))
+    if img.isNull():
+        return img
+    if height_only:
+        return img.scaledToHeight(size, Qt.SmoothTransformation)
+    return img.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+def scaled_pixmap(path: Path, size: int, *, height_only: bool = False) -> QPixmap:
+    """
+    Local image decoded + smooth-scaled once, shared across views through Qt's
+    QPixmapCache (so it counts toward, and is evicted by, Qt's pixmap budget).
+    Fits a size x size box, or just `size` pixels high when height_only=True.
+    """
+    key = _pixmap_key(path, size, height_only)
+    pix = QPixmap()
+    if QPixmapCache.find(key, pix):
+        return pix
+    img = _decode_scaled(path, size, height_only)
+    if img.isNull():
+        return QPixmap()
+    pix = QPixmap.fromImage(img)
+    QPixmapCache.insert(key, pix)
+    return pix
+
+class _PixmapSignals(QObject):
+    decoded = Signal(str, QImage)  # cache key, scaled image
+
+class _PixmapDecodeTask(QRunnable):
+    def __init__(self, key: str, path: Path, size: int, height_only: bool, signals: _PixmapSignals):
+        super().__init__()
+        self._args = (path, size, height_only)
+        self._key = key
+        self._signals = signals
+
+    def run(self):
+        img = _decode_scaled(*self._args)
+        try:
+            self._signals.decoded.emit(self._key, img)
+        except RuntimeError:
+            pass  # signal carrier already deleted (app shutting down)
+
+_pixmap_signals = None
+_pixmap_waiters: Dict[str, List[Callable[[QPixmap], None]]] = {}
+
+def _on_pixmap_decoded(key: str, img: QImage):
+    """GUI thread: convert once, cache, and hand the pixmap to everyone waiting."""
+    pix = QPixmap.fromImage(img) if not img.isNull() else QPixmap()
+    if not pix.isNull():
+        QPixmapCache.insert(key, pix)
+    for cb in _pixmap_waiters.pop(key, []):
+        try:
+            cb(pix)
+        except RuntimeError:
+            pass  # target widget was deleted while decoding
+
+def scaled_pixmap_async(path: Path, size: int, on_ready: Callable[[QPixmap], None], *,
+                        height_only: bool = False) -> None:
+    """
+    Like scaled_pixmap, but a cache miss is decoded on the global thread pool;
+    on_ready(pixmap) runs on the GUI thread (immediately on a cache hit).
+    """
+    global _pixmap_signals
+    key = _pixmap_key(path, size, height_only)
+    pix = QPixmap()
+    if QPixmapCache.find(key, pix):
+        on_ready(pix)
+        return
+    waiters = _pixmap_waiters.setdefault(key, [])
+    waiters.append(on_ready)
+    if len(waiters) > 1:
+        return  # decode already in flight
+    if _pixmap_signals is None:
+        _pixmap_signals = _PixmapSignals()
+        _pixmap_signals.decoded.connect(_on_pixmap_decoded, Qt.QueuedConnection)
+    QThreadPool.globalInstance().start(
+        _PixmapDecodeTask(key, path, size, height_only, _pixmap_signals)
+    )
+
+def make_hover_anim(parent) -> QPropertyAnimation:
+    """Create the geometry animation used for the card hover grow/shrink effect."""
+    anim = QPropertyAnimation(None, b"geometry", parent)
+    anim.setDuration(140)
+    anim.setEasingCurve(QEasingCurve.OutCubic)
+    return anim
+
+class HoverCardMixin:
+    """
+    Hover grow/shrink for list cards; mix in before the widget class
+    (e.g. `class HallCard(HoverCardMixin, QFrame)`) and call _init_hover().
+    The geometry animation is normally one shared by every card of a list view,
+    retargeted to whichever card the pointer is on.
+    """
+    HOVER_GROW_PX = 8
+
+    def _init_hover(self, hover_anim: Optional[QPropertyAnimation] = None):
+        self._base_geom: Optional[QRect] = None
+        self._anim = hover_anim or make_hover_anim(self)
+
+    def reset_hover(self):
+        """Forget the resting geometry (call when the card is moved in its layout)."""
+        self._base_geom = None
+
+    def enterEvent(self, e):
+        """On hover: animate a gentle grow from the resting geometry."""
+        if self._base_geom is None:
+            self._base_geom = self.geometry()
+        g = self._base_geom
+        grow = self.HOVER_GROW_PX
+        self._animate_to(QRect(g.x() - grow // 2, g.y() - grow // 2, g.width() + grow, g.height() + grow))
+        super().enterEvent(e)
+
+    def leaveEvent(self, e):
+        """On hover leave: animate back to the resting geometry."""
+        if self._base_geom is not None:
+            self._animate_to(self._base_geom)
+        super().leaveEvent(e)
+
+    def _animate_to(self, target: QRect):
+        """Retarget the (possibly shared) hover animation to this card."""
+        anim = self._anim
+        prev = anim.targetObject()
+        anim.stop()
+        # Another card was mid-animation: snap it back so it doesn't stay grown
+        if prev is not None and prev is not self and getattr(prev, "_base_geom", None) is not None:
+            prev.setGeometry(prev._base_geom)
+        anim.setTargetObject(self)
+        anim.setStartValue(self.geometry())
+        anim.setEndValue(target)
+        anim.start()
+
+class CardGrid:
+    """
+    Keeps a QGridLayout of cards in sync with a list of card view-models.
+
+    Instead of tearing the grid down, the new card ids are diffed against the
+    previously rendered ones: unchanged runs keep their widgets, removed cards
+    are hidden into a spare pool, and inserted/replaced slots reuse pooled cards.
+    Only cards whose grid cell changed are moved.
+
+    make_card(vm) builds a new card (wired to the view's signals); cards provide
+    update_vm(vm) and reset_hover() (HoverCardMixin). columns() is the number of
+    cards per row for the current viewport.
+    """
+
+    def __init__(self, grid: QGridLayout, make_card: Callable[[Dict], QWidget],
+                 columns: Callable[[], int]):
+        self.grid = grid
+        self._make_card = make_card
+        self._columns = columns
+        # Rendered cards (in order) + their ids and cells, and hidden cards kept for reuse
+        self.cards: List[QWidget] = []
+        self._ids: List[Any] = []
+        self._pos: Dict[QWidget, Tuple[int, int]] = {}
+        self._spare: List[QWidget] = []
+        self.cols = 0  # column count of the last layout pass
+        self._spacer = QSpacerItem(0, 0, QSizePolicy.Minimum, QSizePolicy.Expanding)
+        self._stretch_row = 0
+
+    def sync(self, vms: List[Dict]) -> List[QWidget]:
+        """Show `vms` in order (reusing cards wherever possible); returns the cards."""
+        new_ids = [vm.get("id") for vm in vms]
+        old_cards = self.cards
+        cards: List[QWidget] = []
+
+        matcher = SequenceMatcher(a=self._ids, b=new_ids, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                for card, vm in zip(old_cards[i1:i2], vms[j1:j2]):
+                    card.update_vm(vm)  # same id; refresh if the row data changed
+                    cards.append(card)
+                continue
+
+            # 'replace' rebinds the outgoing cards in place; the rest come from the pool
+            reused = min(i2 - i1, j2 - j1) if tag == "replace" else 0
+            for k, vm in enumerate(vms[j1:j2]):
+                if k < reused:
+                    old_cards[i1 + k].update_vm(vm)
+                    cards.append(old_cards[i1 + k])
+                else:
+                    cards.append(self._take_card(vm))
+            for card in old_cards[i1 + reused:i2]:
+                self._release_card(card)
+
+        self.cards = cards
+        self._ids = new_ids
+        if cards:
+            self._place(cards)
+        return cards
+
+    def _place(self, cards: List[QWidget]):
+        """Move only the cards whose cell changed, then pin the rows to the top."""
+        prev_cols, cols = self.cols, self._columns()
+        self.cols = cols
+        for i, card in enumerate(cards):
+            pos = divmod(i, cols)
+            old = self._pos.get(card)
+            if old != pos:
+                if old is not None:
+                    self.grid.removeWidget(card)
+                self.grid.addWidget(card, *pos)
+                self._pos[card] = pos
+                card.reset_hover()  # geometry will change; re-capture on hover
+
+        # Vertical spacer below the last row (moved only when that row changes)
+        last_row = (len(cards) - 1) // cols + 1
+        if (last_row, cols) == (self._stretch_row, prev_cols) and self.grid.indexOf(self._spacer) != -1:
+            return
+        self.grid.removeItem(self._spacer)
+        self.grid.setRowStretch(self._stretch_row, 0)
+        self.grid.addItem(self._spacer, last_row, 0, 1, cols)
+        self.grid.setRowStretch(last_row, 1)
+        self._stretch_row = last_row
+
+    def _take_card(self, vm: Dict) -> QWidget:
+        """Return a pooled card rebound to `vm`, or a new one from make_card."""
+        if self._spare:
+            card = self._spare.pop()
+            card.update_vm(vm)
+            card.show()
+            return card
+        return self._make_card(vm)
+
+    def _release_card(self, card: QWidget):
+        """Take a card out of the grid and park it (hidden) in the spare pool."""
+        if self._pos.pop(card, None) is not None:
+            self.grid.removeWidget(card)
+        card.hide()
+        self._spare.append(card)
+
+class ShadowFrame(QWidget):
+    """
+    Hosts a card and paints a pre-rendered 9-slice shadow around it.
+    A plain blit per paint instead of QGraphicsDropShadowEffect's offscreen pass.
+    """
+
+    def __init__(self, card: QWidget, parent=None):
+        super().__init__(parent)
+        lay = QVBoxLayout(self)
+        lay.setContentsMargins(*_SHADOW_INSET)
+        lay.addWidget(card)
+
+    def paintEvent(self, _e):
+        pm = cached_pixmap(CARD_SHADOW_PNG)
+        if pm.isNull():
+            return
+        l, t, r, b = _SHADOW_SLICE
+        sw, sh = pm.width(), pm.height()
+        w, h = self.width(), self.height()
+        xs = ((0, l, 0, l), (l, w - l - r, l, sw - l - r), (w - r, r, sw - r, r))
+        ys = ((0, t, 0, t), (t, h - t - b, t, sh - t - b), (h - b, b, sh - b, b))
+        p = QPainter(self)
+        for dx, dw, sx, sw_ in xs:
+            for dy, dh, sy, sh_ in ys:
+                if dw > 0 and dh > 0:
+                    p.drawPixmap(QRect(dx, dy, dw, dh), pm, QRect(sx, sy, sw_, sh_))
+        p.end()
+
+# Spinner frames as icons, built once per frame number (a spinner GIF has only a few)
+_spinner_icons: Dict[int, QIcon] = {}
+
+def _spinner_icon(movie: QMovie) -> QIcon:
+    """Icon for the movie's current frame, reused on every later pass over that frame."""
+    n = movie.currentFrameNumber()
+    icon = _spinner_icons.get(n)
+    if icon is None:
+        icon = _spinner_icons[n] = QIcon(movie.currentPixmap())
+    return icon
+
+# Resolved once at import: loading starts don't stat the candidate files again
+_SPINNER_PATH: Optional[str] = next((str(p) for p in _SPINNER_GIF_PATHS if p.exists()), None)
+
 def _find_spinner():
-    for p in _SPINNER_GIF_PATHS:
-        if p.exists():
-            return str(p)
-    return None
+    return _SPINNER_PATH
+
+# One spinner movie for the whole process: the GIF is decoded and timed once, and
+# each frame is broadcast to every button currently in the loading state
+_spinner_movie: Optional[QMovie] = None
+_spinning: Set[QPushButton] = set()
+
+def _shared_spinner() -> Optional[QMovie]:
+    """Return the shared spinner movie (created on first use), or None without a GIF."""
+    global _spinner_movie
+    if _spinner_movie is None:
+        spinner_path = _find_spinner()
+        if not spinner_path:
+            return None
+        _spinner_movie = QMovie(spinner_path)
+        _spinner_movie.frameChanged.connect(_broadcast_frame)
+    return _spinner_movie
+
+def _broadcast_frame(_frame: int):
+    icon = _spinner_icon(_spinner_movie)
+    for btn in list(_spinning):
+        if isValid(btn):
+            btn.setIcon(icon)
+        else:
+            _spinning.discard(btn)  # button deleted while loading
 
 def start_button_loading(btn: QPushButton, loading_text: str = "מבצע פעולה..."):
     """שם את הכפתור במצב 'טעינה' עם ספינר מסתובב כאייקון."""
@@ -28,16 +358,16 @@ def start_button_loading(btn: QPushButton, loading_text: str = "מבצע פעו
     btn.setDisabled(True)
     btn.setText(loading_text)
 
-    spinner_path = _find_spinner()
-    if spinner_path:
-        movie = QMovie(spinner_path)
-        btn.setProperty("_spinner_movie", movie)
-        # בכל frame נעדכן את האייקון של הכפתור
-        def _update_icon(_):
-            btn.setIcon(QIcon(movie.currentPixmap()))
-        movie.frameChanged.connect(_update_icon)
-        movie.start()
+    movie = _shared_spinner()
+    if movie:
+        # בכל frame נעדכן את האייקון של הכפתור (דרך _broadcast_frame)
+        _spinning.add(btn)
         btn.setIconSize(QSize(20, 20))
+        if movie.state() == QMovie.NotRunning:
+            movie.start()
+        else:
+            movie.setPaused(False)
+            btn.setIcon(_spinner_icon(movie))
     else:
         # ללא GIF — נשאר רק עם הטקסט; עדיין טוב UX-wise
         pass
@@ -46,9 +376,9 @@ def stop_button_loading(btn: QPushButton):
     """מחזיר את הכפתור ממצב 'טעינה' למצב רגיל."""
     if not btn.property("_loading"):
         return
-    movie = btn.property("_spinner_movie")
-    if movie:
-        movie.stop()
+    _spinning.discard(btn)
+    if _spinner_movie is not None and not _spinning:
+        _spinner_movie.setPaused(True)  # no button is loading: stop the frame timer
     orig_text = btn.property("_orig_text") or ""
     orig_icon = btn.property("_orig_icon")
     btn.setText(orig_text)
@@ -56,5 +386,5 @@ def stop_button_loading(btn: QPushButton):
         btn.setIcon(orig_icon)
     btn.setDisabled(False)
     # ניקוי פרופרטיס
-    for prop in ["_loading", "_orig_text", "_orig_icon", "_spinner_movie"]:
+    for prop in ["_loading", "_orig_text", "_orig_icon"]:
         btn.setProperty(prop, None)
@@ -1,43 +1,82 @@
 # user_info_model.py — minimal docs
 # Thin API wrapper around ServerAPI endpoints related to users and their usage.
 
-from typing import List, Dict, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, List, Dict, Optional, Tuple
 from urllib.parse import quote
 from UI import server_access
 
+# Short-lived cache of GET responses keyed by path, shared by all model instances.
+# Calls come from pool threads, hence the lock.
+CACHE_TTL_S = 30.0
+CACHE_MAX_ITEMS = 512
+_cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+def _cached_get(path: str) -> Any:
+    """server_access.request(path), answered from the cache while the entry is fresh."""
+    now = time.monotonic()
+    with _cache_lock:
+        hit = _cache.get(path)
+        if hit is not None and now - hit[0] <= CACHE_TTL_S:
+            _cache.move_to_end(path)
+            return hit[1]
+    data = server_access.request(path)
+    with _cache_lock:
+        _cache[path] = (time.monotonic(), data)
+        _cache.move_to_end(path)
+        while len(_cache) > CACHE_MAX_ITEMS:
+            _cache.popitem(last=False)
+    return data
+
 class UserInfoModel:
     """Lightweight service to fetch a user and their related usage (decor/services/halls/owned)."""
 
     def __init__(self):
-        """Initialize the model (no internal state for now)."""
+        """Initialize the model (responses are cached module-wide, see _cached_get)."""
         pass
 
+    def invalidate(self, user_id: Optional[int] = None) -> None:
+        """Drop cached sections of `user_id` (all cached responses when None), e.g. after an add."""
+        prefix = f"/DB/users/{user_id}/"
+        with _cache_lock:
+            for path in [p for p in _cache if user_id is None or p.startswith(prefix)]:
+                del _cache[path]
+
     def get_user(self, username: str) -> Optional[Dict]:
         """
         Fetch a user by username.
         """
-        return server_access.request(f"/DB/users/get_user_by_name/{quote(username)}")
+        return _cached_get(f"/DB/users/get_user_by_name/{quote(username)}")
 
     def get_decor_used(self, user_id: int) -> List[Dict]:
         """
         Fetch decors used by the given user.
         """
-        return server_access.request(f"/DB/users/{user_id}/decor/used")
+        return _cached_get(f"/DB/users/{user_id}/decor/used")
 
     def get_services_used(self, user_id: int) -> List[Dict]:
         """
         Fetch services used by the given user.
         """
-        return server_access.request(f"/DB/users/{user_id}/services/used")
+        return _cached_get(f"/DB/users/{user_id}/services/used")
 
     def get_halls_used(self, user_id: int) -> List[Dict]:
         """
         Fetch halls used by the given user.
         """
-        return server_access.request(f"/DB/users/{user_id}/halls/used")
+        return _cached_get(f"/DB/users/{user_id}/halls/used")
 
     def get_owned_items(self, user_id: int) -> List[Dict]:
         """
         Fetch items owned by the given user.
         """
-        return server_access.request(f"/DB/users/{user_id}/owned")
+        return _cached_get(f"/DB/users/{user_id}/owned")
+
+    def get_profile_bundle(self, user_id: int) -> Dict[str, List[Dict]]:
+        """
+        Fetch all profile sections in one call: {"decor", "services", "halls", "owned"}.
+        """
+        return _cached_get(f"/DB/users/{user_id}/profile_bundle")
@@ -2,50 +2,85 @@
 # Presenter for the "User Info" screen (MVP).
 # - Orchestrates Model (data fetching) and View (rendering).
 # - Loads a user by username, populates header and section cards.
+# - Server calls run on the thread pool: the user row, then every section in
+#   one aggregate request (profile bundle).
 
-from typing import Optional
+from PySide6.QtCore import QObject, QThreadPool, Qt, Slot
+from UI.server_access import Fetcher, FetchSignals
 from .user_info_model import UserInfoModel
 from .user_info_view import UserInfoView
 
-class UserInfoPresenter:
+class UserInfoPresenter(QObject):
 
     def __init__(self, model: UserInfoModel, view: UserInfoView):
         """Store references to the Model (data) and the View (UI)."""
-        self.m = model
-        self.v = view
-        # Future: connect signals (refresh, click handlers, etc.)
+        super().__init__()
+        self.model = model
+        self.view = view
+        self._seq = 0  # bumped per start(); results tagged with an older value are dropped
+        self._username = ""
+        self._uid = None  # UserId of the loaded user, once known
+        self._fetch = FetchSignals(self)
+        self._fetch.finished.connect(self._on_fetched, Qt.QueuedConnection)
+        self._fetch.failed.connect(self._on_failed, Qt.QueuedConnection)
+        # bundle key -> view renderer name (rows arrive with their "pill" label from SQL);
+        # names, not bound methods, so a disposed presenter holds no view reference
+        self._sections = {
+            "decor": "show_decor_cards",
+            "services": "show_service_cards",
+            "halls": "show_hall_cards",
+            "owned": "show_owned_cards",
+        }
 
     def start(self, username: str) -> None:
         """
-        Load user data and render the screen.
+        Load user data and render the screen (asynchronously).
         """
-        user = self.m.get_user(username)
+        self._seq += 1
+        self._username = username
+        self._submit("user", lambda: self.model.get_user(username))
+
+    def reload(self) -> None:
+        """Re-load the current user, bypassing cached sections (after the user changed data)."""
+        self.model.invalidate(self._uid)
+        self.start(self._username)
+
+    def _submit(self, what: str, fn) -> None:
+        QThreadPool.globalInstance().start(Fetcher(fn, self._fetch, (self._seq, what)))
+
+    @Slot(object, object)
+    def _on_fetched(self, tag, result) -> None:
+        seq, what = tag
+        if seq != self._seq or self.view is None:
+            return
+        if what == "user":
+            self._on_user(result)
+        else:
+            self._show_sections(result if isinstance(result, dict) else {})
+
+    @Slot(object, str)
+    def _on_failed(self, tag, _msg: str) -> None:
+        seq, what = tag
+        if seq != self._seq or self.view is None:
+            return
+        if what == "user":
+            self._on_user(None)
+        else:
+            self._show_sections({})
+
+    def _on_user(self, user) -> None:
         if not user:
             # Empty state
-            self.v.set_user_header(username, "", "")
-            self.v.show_decor_cards([])
-            self.v.show_service_cards([])
-            self.v.show_hall_cards([])
-            self.v.show_owned_cards([])
+            self.view.set_user_header(self._username, "", "")
+            self._show_sections({})
             return
 
-        uid = int(user["UserId"])
-        self.v.set_user_header(user["Username"], user["Phone"], user["Region"])
-
-        decs = self.m.get_decor_used(uid)
-        svcs = self.m.get_services_used(uid)
-        halls = self.m.get_halls_used(uid)
-        owned = self.m.get_owned_items(uid)
-
-        # Mark used sections with a small pill label (owned already includes it from SQL).
-        for it in decs:
-            it["pill"] = "Decor"
-        for it in svcs:
-            it["pill"] = "Service"
-        for it in halls:
-            it["pill"] = "Hall"
-
-        self.v.show_decor_cards(decs)
-        self.v.show_service_cards(svcs)
-        self.v.show_hall_cards(halls)
-        self.v.show_owned_cards(owned)
+        uid = self._uid = int(user["UserId"])
+        self.view.set_user_header(user["Username"], user["Phone"], user["Region"])
+
+        # All four sections in a single round-trip
+        self._submit("bundle", lambda: self.model.get_profile_bundle(uid))
+
+    def _show_sections(self, bundle: dict) -> None:
+        for key, render in self._sections.items():
+            getattr(self.view, render)(bundle.get(key) or [])
@@ -41,6 +41,10 @@ BEGIN
         WebsiteUrl NVARCHAR(500) NULL,
         PhotoUrl NVARCHAR(500) NULL
     );
+
+    CREATE INDEX IX_Hall_Type       ON dbo.Hall(HallType);
+    CREATE INDEX IX_Hall_Region     ON dbo.Hall(Region);
+    CREATE INDEX IX_Hall_Accessible ON dbo.Hall(WheelchairAccessible) WHERE WheelchairAccessible = 1;
 END;
 
 -- decoration options
@@ -4,6 +4,7 @@ Events Backend (Demo) – FastAPI routes.
 queries are delegated to server.database.query_api;
 commands are delegated to server.database.command_api.
 """
+import pyodbc
 from typing import Optional, Dict, Any, List
 import server.database.query_api as query_api
 from server.database import command_api
@@ -115,6 +116,11 @@ def user_owned_items(user_id: int) -> List[Dict[str, Any]]:
     """List all assets owned by the user (union of Hall/Service/Decor)."""
     return query_api.get_owned_items_by_user(user_id)
 
+@app.get("/DB/users/{user_id}/profile_bundle")
+def user_profile_bundle(user_id: int) -> Dict[str, List[Dict[str, Any]]]:
+    """All profile sections of the user at once: used decor/services/halls and owned items."""
+    return query_api.get_profile_bundle(user_id)
+
 @app.get("/DB/decors/prices")
 def list_decor_prices(
     search: Optional[str] = None,
@@ -167,7 +173,7 @@ def list_halls(
         offset=offset,
     )
 
-from fastapi import Body
+from fastapi import Body, HTTPException
 
 @app.post("/DB/decors/create")
 def create_decor(
@@ -218,4 +224,23 @@ def link_user_decor(
     decor_id: int = Body(..., alias="DecorId"),
     relation_type: str = Body("OWNER", alias="RelationType"),
 ) -> int:
-    return command_api.link_user_decor(user_id, decor_id, relation_type)
\ No newline at end of file
+    return command_api.link_user_decor(user_id, decor_id, relation_type)
+
+@app.post("/DB/users/register")
+def register_user(
+    phone: str = Body(..., alias="Phone"),
+    username: str = Body(..., alias="Username"),
+    password_hash: str = Body(..., alias="PasswordHash"),
+    region: str = Body(..., alias="Region"),
+) -> Dict[str, Any]:
+    """
+    Create a user in one round-trip: uniqueness check + insert, returning the new UserId.
+    A taken username is a normal answer (ok=False); a database failure is a 503.
+    """
+    try:
+        user_id = command_api.register_user(phone, username, password_hash, region)
+    except pyodbc.Error:
+        raise HTTPException(status_code=503, detail="Database unavailable, try again later.")
+    if user_id is None:
+        return {"ok": False, "reason": "Username already exists.", "user_id": None}
+    return {"ok": True, "reason": "", "user_id": user_id}
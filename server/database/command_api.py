@@ -1,7 +1,8 @@
 """
 class for commands
 """
-from typing import Dict, Any
+import pyodbc
+from typing import Dict, Any, Optional
 from server.gateway.DBgateway import DbGateway
 
 db = DbGateway()
@@ -18,6 +19,33 @@ def add_user(
     params = (phone, username, password_hash, region)
     return db.execute(sql, params)
 
+def register_user(
+    phone: str,
+    username: str,
+    password_hash: str,
+    region: str
+) -> Optional[int]:
+    """
+    Add a user unless the username is taken, in one statement (check + insert are
+    atomic under the key-range lock). Returns the new UserId, or None if taken.
+    Database errors are raised (pyodbc.Error), not reported as "taken".
+    """
+    sql = """
+        INSERT INTO dbo.Users (Phone, Username, PasswordHash, Region)
+        OUTPUT INSERTED.UserId
+        SELECT ?, ?, ?, ?
+        WHERE NOT EXISTS (
+            SELECT 1 FROM dbo.Users WITH (UPDLOCK, HOLDLOCK) WHERE Username = ?
+        );
+    """
+    try:
+        rows = db.query(sql, (phone, username, password_hash, region, username), reraise=True)
+    except pyodbc.IntegrityError:
+        return None  # unique key on Username hit by a concurrent insert
+    if not rows or "UserId" not in rows[0]:
+        return None
+    return int(rows[0]["UserId"])
+
 # Add new decoration into DB
 def add_decor_option(d: Dict[str, Any]) -> int:
     cols = [
@@ -1,9 +1,15 @@
 from __future__ import annotations
+import logging
+import os
 import weakref
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, Set
-from PySide6.QtCore import QObject, Signal, QUrl, QSize, Qt
-from PySide6.QtGui import QPixmap
+from typing import Optional, Dict, Set, Tuple
+from PySide6.QtCore import (
+    QObject, Signal, QUrl, QSize, Qt, QRunnable, QThreadPool,
+    QBuffer, QByteArray, QIODevice,
+)
+from PySide6.QtGui import QPixmap, QPixmapCache, QImage, QImageReader
 from PySide6.QtNetwork import (
     QNetworkAccessManager,
     QNetworkRequest,
@@ -12,6 +18,8 @@ from PySide6.QtNetwork import (
 from PySide6.QtWidgets import QLabel
 from shiboken6 import isValid as _sbk_is_valid
 
+_log = logging.getLogger(__name__)
+
 # ------------------------------ helpers -------------------------------------
 
 def _as_int(x) -> Optional[int]:
@@ -28,6 +36,33 @@ def _as_int(x) -> Optional[int]:
         except Exception:
             return None
 
+def normalize_url(url: str) -> str:
+    """
+    Canonical cache key for an image URL (trimmed, normalized by QUrl) so the
+    same asset spelled slightly differently shares a single cache entry.
+    """
+    url = (url or "").strip()
+    q = QUrl(url)
+    return q.toString(QUrl.NormalizePathSegments) if q.isValid() else url
+
+def _lru_get(cache: "OrderedDict", key):
+    """Return cache[key] (marking it most-recently used) or None."""
+    val = cache.get(key)
+    if val is not None:
+        cache.move_to_end(key)
+    return val
+
+def _lru_put(cache: "OrderedDict", key, val, max_items: int) -> None:
+    """Insert into an OrderedDict LRU, evicting the least-recently used entries."""
+    cache[key] = val
+    cache.move_to_end(key)
+    while len(cache) > max_items:
+        cache.popitem(last=False)
+
+def _scaled_key(origin: str, w: int, h: int) -> str:
+    """QPixmapCache key for `origin` scaled to w×h."""
+    return f"img:{w}x{h}:{origin}"
+
 def _is_valid(obj) -> bool:
     """
     Return True if the Qt object is still alive and valid.
@@ -37,14 +72,65 @@ def _is_valid(obj) -> bool:
         return False
     return bool(_sbk_is_valid(obj))
 
+# ------------------------------ decode worker -------------------------------
+
+class _DecodeSignals(QObject):
+    """Signal carrier for _DecodeTask (QRunnable is not a QObject)."""
+    decoded = Signal(str, QImage, object)  # origin, image (null on failure), {(w, h): scaled QImage}
+
+
+class _DecodeTask(QRunnable):
+    """
+    Decode downloaded image bytes into a QImage on a pool thread, and produce
+    the already-requested display sizes there too (smooth scaling is costly).
+    QImage is safe to use off the GUI thread; QPixmap is not, so the
+    conversion to QPixmap happens back on the GUI thread.
+    """
+
+    def __init__(self, origin: str, data: bytes, sizes: Set[Tuple[int, int]], signals: _DecodeSignals):
+        super().__init__()
+        self._origin = origin
+        self._data = data
+        self._sizes = sizes
+        self._signals = signals
+
+    # Shorter side of decoded images is capped here (≈2× the largest display
+    # size, for HiDPI); big JPEGs are then decoded at reduced resolution.
+    MAX_DECODE_SIDE = 1024
+
+    def _decode(self) -> QImage:
+        """Decode the payload, downsampling oversized photos while decoding."""
+        buf = QBuffer()
+        buf.setData(QByteArray(self._data))
+        buf.open(QIODevice.ReadOnly)
+        reader = QImageReader(buf)
+        reader.setAutoTransform(True)
+        full = reader.size()
+        cap = self.MAX_DECODE_SIDE
+        if full.isValid() and full.width() > cap and full.height() > cap:
+            reader.setScaledSize(full.scaled(cap, cap, Qt.KeepAspectRatioByExpanding))
+        return reader.read()
+
+    def run(self) -> None:
+        img = self._decode()
+        scaled: Dict[Tuple[int, int], QImage] = {}
+        if not img.isNull():
+            for w, h in self._sizes:
+                scaled[(w, h)] = img.scaled(w, h, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+        try:
+            self._signals.decoded.emit(self._origin, img, scaled)
+        except RuntimeError:
+            pass  # loader deleted while decoding (app shutting down)
+
 # ------------------------------ core loader ---------------------------------
 
 class ImageLoader(QObject):
     """
     Asynchronous image loader with:
-      • On-disk HTTP cache (QNetworkDiskCache)
-      • In-memory pixmap cache (by *origin* URL)
+      • On-disk HTTP cache (QNetworkDiskCache, size-bounded, cache-first)
+      • In-memory LRU pixmap cache (by *origin* URL)
       • In-flight de-duplication per origin URL
+      • Image decoding on a QThreadPool (off the GUI thread)
       • Redirect handling that works across Qt 5.15 and Qt 6
 
     Signals
@@ -56,6 +142,10 @@ class ImageLoader(QObject):
 
     pixmapReady = Signal(str, QPixmap)
 
+    # Cache bounds
+    MEM_CACHE_ITEMS = 256            # decoded pixmaps kept in RAM
+    DISK_CACHE_BYTES = 200 * 1024 * 1024
+
     def __init__(self, cache_dir: Path, parent=None):
         """
         Create a loader with both disk and RAM caching.
@@ -75,14 +165,28 @@ class ImageLoader(QObject):
         self.nam = QNetworkAccessManager(self)
         disk = QNetworkDiskCache(self)
         disk.setCacheDirectory(str(cache_dir))
+        disk.setMaximumCacheSize(self.DISK_CACHE_BYTES)
         self.nam.setCache(disk)
 
-        # Simple in-memory cache: origin_url -> QPixmap
-        self._mem: Dict[str, QPixmap] = {}
+        # In-memory LRU: origin_url -> QPixmap
+        self._mem: "OrderedDict[str, QPixmap]" = OrderedDict()
+
+        # Scaled variants shared across views live in Qt's QPixmapCache, keyed by
+        # _scaled_key(origin, w, h); its one app-wide budget is set by AppWindow
+        # (ui_helpers.PIXMAP_CACHE_KB)
 
         # Tracks URLs currently being fetched (by origin) to avoid duplicate requests
         self._inflight: Set[str] = set()
 
+        # Display sizes requested per in-flight origin; pre-scaled on the decode pool
+        self._want_sizes: Dict[str, Set[Tuple[int, int]]] = {}
+
+        # Decoding runs on a small private pool; results come back as queued signals
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(4)
+        self._decode_signals = _DecodeSignals(self)
+        self._decode_signals.decoded.connect(self._on_decoded, Qt.QueuedConnection)
+
     # ------------------------------ internals --------------------------------
 
     def _set_follow_redirects(self, req: QNetworkRequest) -> None:
@@ -110,9 +214,48 @@ class ImageLoader(QObject):
             # Be permissive: failure here is not fatal, manual redirect follows later
             pass
 
+    def _allow_http2(self, req: QNetworkRequest) -> None:
+        """
+        Let all thumbnail requests to the same CDN share one multiplexed HTTP/2
+        connection (default on Qt 6; opt-in on Qt 5.15).
+        """
+        attr = getattr(QNetworkRequest, "Http2AllowedAttribute", None)
+        if attr is not None:
+            req.setAttribute(attr, True)
+
     # ------------------------------ public API --------------------------------
 
-    def fetch(self, url: str, *, origin: Optional[str] = None) -> None:
+    def preconnect(self, url: str) -> None:
+        """
+        Open (and keep alive) a connection to the host of `url` ahead of time so
+        the first image fetch doesn't pay the TCP/TLS handshake. Later requests
+        reuse the same pooled connection via the shared QNetworkAccessManager.
+        """
+        q = QUrl(url)
+        if not q.host():
+            return
+        if q.scheme() == "https":
+            self.nam.connectToHostEncrypted(q.host(), q.port(443))
+        else:
+            self.nam.connectToHost(q.host(), q.port(80))
+
+    def cached(self, origin: str) -> Optional[QPixmap]:
+        """Return the decoded pixmap for `origin` if it is already in memory."""
+        return _lru_get(self._mem, origin)
+
+    def scaled(self, origin: str, pm: QPixmap, size: QSize) -> QPixmap:
+        """
+        Return `pm` scaled to `size`, memoized per (origin, size) so cards sharing
+        an image (e.g. the default placeholder) reuse one scaled pixmap.
+        """
+        key = _scaled_key(origin, size.width(), size.height())
+        out = QPixmap()
+        if not QPixmapCache.find(key, out):
+            out = pm.scaled(size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+            QPixmapCache.insert(key, out)
+        return out
+
+    def fetch(self, url: str, *, origin: Optional[str] = None, size: Optional[QSize] = None) -> None:
         """
         Fetch `url` asynchronously. If a redirect occurs, the original `origin`
         is preserved so listeners receive the same key they requested.
@@ -123,27 +266,38 @@ class ImageLoader(QObject):
         origin : Optional[str]
             The logical key under which the result will be emitted and cached.
             Defaults to `url`. Pass the *original* URL when following redirects.
+        size : Optional[QSize]
+            Display size the caller will ask `scaled()` for; it is produced on the
+            decode pool so the GUI thread doesn't do the smooth scaling.
         """
         origin = origin or url
 
         # 1) In-memory cache hit
-        if origin in self._mem:
-            print("[IMG] mem-hit:", origin)
-            self.pixmapReady.emit(origin, self._mem[origin])
+        pm = _lru_get(self._mem, origin)
+        if pm is not None:
+            _log.debug("[IMG] mem-hit: %s", origin)
+            self.pixmapReady.emit(origin, pm)
             return
 
+        if size is not None:
+            self._want_sizes.setdefault(origin, set()).add((size.width(), size.height()))
+
         # 2) Already being fetched → skip duplicate request
         if origin in self._inflight:
-            print("[IMG] inflight-skip:", origin)
+            _log.debug("[IMG] inflight-skip: %s", origin)
             return
 
         # 3) Made a network request
         self._inflight.add(origin)
-        print("[IMG] fetch:", url, "(origin:", origin, ")")
+        _log.debug("[IMG] fetch: %s (origin: %s)", url, origin)
 
         req = QNetworkRequest(QUrl(url))
         self._set_follow_redirects(req)
+        self._allow_http2(req)
         req.setRawHeader(b"User-Agent", b"QtImageLoader/1.0")
+        # Serve from the disk cache when fresh; QNetworkDiskCache revalidates
+        # stale entries with the stored ETag/Last-Modified (conditional GET)
+        req.setAttribute(QNetworkRequest.CacheLoadControlAttribute, QNetworkRequest.PreferCache)
 
         reply = self.nam.get(req)
         reply.finished.connect(lambda r=reply, u=url, o=origin: self._on_finished(u, o, r))
@@ -154,15 +308,14 @@ class ImageLoader(QObject):
         """
         Handle a finished network reply:
           • Follow redirects (manually, for cross-version consistency)
-          • Convert payload to QPixmap
-          • Update caches and emit pixmapReady
+          • Hand the payload to the decode pool (see _on_decoded)
         """
         QNR = QNetworkRequest
 
         status = _as_int(reply.attribute(QNR.HttpStatusCodeAttribute))
         err = reply.error()
         err_i = _as_int(err)
-        print(f"[IMG] done: {url} | status={status} err={err_i} ({err})")
+        _log.debug("[IMG] done: %s | status=%s err=%s (%s)", url, status, err_i, err)
 
         # Manual redirect handling (works the same on 5.15/6.x)
         try:
@@ -172,36 +325,76 @@ class ImageLoader(QObject):
 
         if status in (301, 302, 303, 307, 308) and redir:
             new_url = QUrl(redir).toString()
-            print("[IMG] redirect ->", new_url, "| origin:", origin)
+            _log.debug("[IMG] redirect -> %s | origin: %s", new_url, origin)
             reply.deleteLater()
             # Keep the original origin so the cache/signal key remains stable
+            self._inflight.discard(origin)
             self.fetch(new_url, origin=origin)
             return
 
         # Network error → clear inflight & bail
         if err_i not in (None, 0):
+            _log.warning("[IMG] load failed: %s (%s)", url, err)
             self._inflight.discard(origin)
+            self._want_sizes.pop(origin, None)
             reply.deleteLater()
             return
 
-        # Read all data and attempt to decode into a pixmap
-        data = reply.readAll()
-        pm = QPixmap()
-        pm.loadFromData(bytes(data))
+        # Read all data and decode it off the GUI thread
+        data = bytes(reply.readAll())
         reply.deleteLater()
+        sizes = self._want_sizes.pop(origin, set())
+        self._pool.start(_DecodeTask(origin, data, sizes, self._decode_signals))
 
+    def _on_decoded(self, origin: str, img: QImage, scaled: Dict[Tuple[int, int], QImage]) -> None:
+        """
+        GUI-thread slot for a finished decode:
+          • Convert QImages to QPixmaps (cheap, no codec/scaling work)
+          • Update caches and emit pixmapReady
+        """
         self._inflight.discard(origin)
 
         # Success: store in RAM cache and notify listeners
-        if not pm.isNull():
-            self._mem[origin] = pm
+        if not img.isNull():
+            pm = QPixmap.fromImage(img)
+            _lru_put(self._mem, origin, pm, self.MEM_CACHE_ITEMS)
+            for (w, h), simg in scaled.items():
+                QPixmapCache.insert(_scaled_key(origin, w, h), QPixmap.fromImage(simg))
             self.pixmapReady.emit(origin, pm)
 
 
 # ------------------------------ singleton + view helper ----------------------
 
 BASE_DIR = Path(__file__).resolve().parent
-IMAGE_LOADER = ImageLoader(BASE_DIR / "http_cache")
+
+def _http_cache_dir() -> Path:
+    """
+    Per-user HTTP cache (LOCALAPPDATA on Windows, ~/.cache elsewhere), next to the
+    app's QSS cache; the package directory may be read-only once installed.
+    """
+    base = os.getenv("LOCALAPPDATA")
+    return (Path(base) if base else Path.home() / ".cache") / "EventPlanner" / "http_cache"
+
+IMAGE_LOADER = ImageLoader(_http_cache_dir())
+
+# Host serving catalog photos and the default card image
+IMAGE_CDN_URL = "https://cdn.jsdelivr.net/"
+
+
+def _scaled_placeholder(path: Path, size: QSize) -> QPixmap:
+    """
+    Local placeholder scaled to `size`, read from disk and scaled once per
+    (path, size); every card built afterwards shares the QPixmapCache entry.
+    """
+    key = _scaled_key(f"file:{path}", size.width(), size.height())
+    out = QPixmap()
+    if not QPixmapCache.find(key, out):
+        src = QPixmap(str(path))
+        if src.isNull():
+            return src
+        out = src.scaled(size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+        QPixmapCache.insert(key, out)
+    return out
 
 
 def load_into(
@@ -225,17 +418,22 @@ def load_into(
     placeholder : Optional[Path] - A local placeholder image to show immediately while loading.
     size : Optional[QSize] - Target size for scaling. Defaults to the label's current size.
     """
+    url = normalize_url(url)
+
     # Record the requested URL on the label to prevent races (e.g., reused views)
     label.setProperty("img_url", url)
 
+    # Fast path: already decoded → share the cached (scaled) pixmap, no signal hookup
+    pm = IMAGE_LOADER.cached(url)
+    if pm is not None:
+        label.setPixmap(IMAGE_LOADER.scaled(url, pm, size or label.size()))
+        return
+
     # 1) Show placeholder immediately (if provided and valid)
     if placeholder:
-        ph = QPixmap(str(placeholder))
+        ph = _scaled_placeholder(placeholder, size or label.size())
         if not ph.isNull():
-            target = size or label.size()
-            label.setPixmap(
-                ph.scaled(target, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-            )
+            label.setPixmap(ph)
 
     # 2) Connect to the loader signal safely using a weak reference
     wref = weakref.ref(label)
@@ -268,10 +466,7 @@ def load_into(
             _safe_disconnect(_on_ready)
             return
 
-        target = size or lbl.size()
-        lbl.setPixmap(
-            pm.scaled(target, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-        )
+        lbl.setPixmap(IMAGE_LOADER.scaled(url, pm, size or lbl.size()))
         _safe_disconnect(_on_ready)
 
     # Connect and ensure we disconnect if the label dies
@@ -279,4 +474,4 @@ def load_into(
     label.destroyed.connect(lambda *_: _safe_disconnect(_on_ready))
 
     # 3) Trigger the fetch
-    IMAGE_LOADER.fetch(url, origin=url)
\ No newline at end of file
+    IMAGE_LOADER.fetch(url, origin=url, size=size)
\ No newline at end of file
@@ -28,12 +28,14 @@ Decor:
 
 User ownership:
 - get_owned_items_by_user():  All assets owned by a given user (union of hall/service/decor).
+- get_profile_bundle():       Used decor/services/halls + owned items of a user, in one dict.
 
 DB:
 - get_tables_name():          Return all tables names.
 
 Utilities:
 - _fetchall_dicts():          Convert pyodbc cursor results to list of dicts.
+- _like_contains():           Build an escaped '%text%' LIKE pattern.
 - print_table():              Pretty-print rows in tabular format.
 """
 
@@ -52,6 +54,14 @@ def _fetchall_dicts(cur: pyodbc.Cursor) -> List[Dict[str, Any]]:
     cols = [d[0] for d in cur.description]
     return [dict(zip(cols, row)) for row in cur.fetchall()]
 
+def _like_contains(text: str) -> str:
+    """
+    '%text%' pattern for LIKE with the user's text taken literally
+    (T-SQL wildcards %, _ and [ are bracket-escaped).
+    """
+    escaped = text.replace("[", "[[]").replace("%", "[%]").replace("_", "[_]")
+    return f"%{escaped}%"
+
 def print_table(
         rows: Sequence[Dict[str, Any]],
         columns: Optional[Sequence[str]] = None,
@@ -204,7 +214,7 @@ def get_decor_cards(
         sql += " AND d.Available = 0"
 
     if search:
-        like = f"%{search}%"
+        like = _like_contains(search)
         sql += " AND (d.DecorName LIKE ? OR d.Description LIKE ? OR d.Theme LIKE ?)"
         params.extend([like, like, like])
 
@@ -292,7 +302,7 @@ def get_service_cards(
         sql += " AND s.Available = 0"
 
     if search:
-        like = f"%{search}%"
+        like = _like_contains(search)
         sql += """
         AND (
             s.ServiceName LIKE ?
@@ -329,7 +339,7 @@ def get_hall_cards(
     Return a slim list of halls for cards, with optional filters & paging.
 
     Filters:
-      - search: free-text over HallName, Description
+      - search: free-text over HallName, Description, HallType, Region
       - hall_type: exact match (ignore if 'All'/'')
       - accessible: True/False (filters by WheelchairAccessible)
       - region: exact match (ignore if 'All'/'')
@@ -384,10 +394,19 @@ def get_hall_cards(
     elif accessible is False:
         sql += " AND h.WheelchairAccessible = 0"
 
+    # Substring search can't seek an index (leading wildcard), so it runs last,
+    # as a residual predicate over the rows the indexed facets above leave.
     if search:
-        like = f"%{search}%"
-        sql += " AND (h.HallName LIKE ? OR h.Description LIKE ?)"
-        params.extend([like, like])
+        like = _like_contains(search)
+        sql += """
+        AND (
+            h.HallName LIKE ?
+            OR h.Description LIKE ?
+            OR h.HallType LIKE ?
+            OR h.Region LIKE ?
+        )
+        """
+        params.extend([like, like, like, like])
 
     # Ordering
     sql += f" ORDER BY {order_col} {order_dir}"
@@ -426,7 +445,8 @@ def get_decor_used_by_user(user_id: int) -> List[Dict[str, Any]]:
            d.DecorName AS title,
            CONCAT(d.Category, COALESCE(' · ' + d.Theme, '')) AS subtitle,
            d.Region AS region,
-           d.PhotoUrl AS photo
+           d.PhotoUrl AS photo,
+           'Decor' AS pill
     FROM dbo.UserDecor ud
     INNER JOIN dbo.DecorOption d ON d.DecorId = ud.DecorId
     WHERE ud.UserId = ? AND ud.RelationType = 'USER'
@@ -441,7 +461,8 @@ def get_services_used_by_user(user_id: int) -> List[Dict[str, Any]]:
            s.ServiceName AS title,
            COALESCE(s.ShortDescription, s.Subcategory) AS subtitle,
            s.Region AS region,
-           s.PhotoUrl AS photo
+           s.PhotoUrl AS photo,
+           'Service' AS pill
     FROM dbo.UserServiceLink us
     INNER JOIN dbo.ServiceOption s ON s.ServiceId = us.ServiceId
     WHERE us.UserId = ? AND us.RelationType = 'USER'
@@ -456,7 +477,8 @@ def get_halls_used_by_user(user_id: int) -> List[Dict[str, Any]]:
            h.HallName AS title,
            h.HallType AS subtitle,
            h.Region AS region,
-           h.PhotoUrl AS photo
+           h.PhotoUrl AS photo,
+           'Hall' AS pill
     FROM dbo.UserHall uh
     INNER JOIN dbo.Hall h ON h.HallId = uh.HallId
     WHERE uh.UserId = ? AND uh.RelationType = 'USER'
@@ -505,6 +527,15 @@ def get_owned_items_by_user(user_id: int) -> List[Dict[str, Any]]:
     """
     return db.query(sql, (user_id, user_id, user_id))
 
+def get_profile_bundle(user_id: int) -> Dict[str, List[Dict[str, Any]]]:
+    """ Get every profile section of a single user (one API call for the User Info screen)"""
+    return {
+        "decor": get_decor_used_by_user(user_id),
+        "services": get_services_used_by_user(user_id),
+        "halls": get_halls_used_by_user(user_id),
+        "owned": get_owned_items_by_user(user_id),
+    }
+
 def get_decor_prices(
         search: Optional[str] = None,
         category: Optional[str] = None,
@@ -582,7 +613,7 @@ def get_decor_prices(
         sql += " AND d.Available = 0"
 
     if search:
-        like = f"%{search}%"
+        like = _like_contains(search)
         sql += " AND (d.DecorName LIKE ? OR d.Description LIKE ? OR d.Theme LIKE ?)"
         params.extend([like, like, like])
 
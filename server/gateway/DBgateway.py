@@ -4,8 +4,12 @@ from typing import List, Dict, Any
 
 class DbGateway:
     """Gateway for SQL Server operations"""
-    def query(self, sql: str, params: tuple = None) -> List[Dict[str, Any]]:
-        """Run SELECT and return all rows as list of dicts {column: value}"""
+    def query(self, sql: str, params: tuple = None, reraise: bool = False) -> List[Dict[str, Any]]:
+        """
+        Run SELECT and return all rows as list of dicts {column: value}.
+        Errors are logged and give [] unless `reraise` is set (callers that must
+        tell "no rows" apart from a failed statement).
+        """
         try:
             with get_connection() as conn:
                 cur = conn.cursor()
@@ -19,6 +23,8 @@ class DbGateway:
                 return rows
         except pyodbc.Error as e:
             print(f"[DbGateway] Query error: {e}")
+            if reraise:
+                raise
             return []
 
     def execute(self, sql: str, params: tuple = None, commit: bool = True) -> int: